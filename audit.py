@@ -1,10 +1,88 @@
 # audit.py -- Append-only audit logger for the Secret Management Vault.
 # Implements DESIGN.md Component 3.4: structured audit log entries with
-# pipe-separated fields and append-only file semantics.
+# pipe-separated fields and append-only file semantics. Each entry carries
+# a truncated SHA-256 of the previous line so edits can be detected.
 # Fulfills: REQ-AUD-001, REQ-AUD-002, REQ-AUD-003, REQ-AUD-004, REQ-AUD-005
 
-import datetime
-from pathlib import Path
+import atexit
+import hashlib
+import os
+import re
+import threading
+import time
+
+_TAIL_BLOCK_SIZE = 8192
+
+# Default seconds between summary records for AuditLogger.count_event()
+SUMMARY_INTERVAL = 5.0
+
+# Hash-chain field: hex prefix of SHA-256 over the previous line
+_CHAIN_HEX_LEN = 16
+_GENESIS_HASH = "0" * _CHAIN_HEX_LEN
+_CHAIN_RE = re.compile(r"([0-9a-f]{16}) \| ")
+
+
+def _hash_line(line: str) -> str:
+    """Return the chain hash of a log line (trailing whitespace ignored)."""
+    return hashlib.sha256(line.rstrip().encode("utf-8")).hexdigest()[:_CHAIN_HEX_LEN]
+
+
+def _last_line_hash(audit_file: str) -> str:
+    """Return the chain hash of the last entry, or the genesis hash if none."""
+    try:
+        tail = _read_tail(audit_file, 1)
+    except FileNotFoundError:
+        return _GENESIS_HASH
+    return _hash_line(tail[-1]) if tail else _GENESIS_HASH
+
+
+def _chain_lines(prev_hash: str, bodies: list[str]) -> tuple[list[str], str]:
+    """Prefix each body with the hash of the line before it.
+
+    Returns:
+        Tuple of (chained lines, hash of the last chained line).
+    """
+    lines = []
+    for body in bodies:
+        line = f"{prev_hash} | {body}"
+        prev_hash = _hash_line(line)
+        lines.append(line)
+    return lines, prev_hash
+
+
+# (second, "YYYY-MM-DDTHH:MM:SS") of the most recent timestamp
+_ts_second_cache: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time in ISO 8601 with microseconds.
+
+    Equivalent to datetime.now(timezone.utc).isoformat() (except that the
+    microseconds field is always present), but without building a datetime;
+    the formatted date/time prefix is reused within the same second. Also
+    used for the created_at field of secret versions.
+    """
+    global _ts_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _ts_second_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _ts_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+def _format_line(
+    identity: str,
+    operation: str,
+    path: str | None,
+    outcome: str,
+    detail: str | None = None,
+) -> str:
+    """Build one pipe-separated audit line (without trailing newline)."""
+    timestamp = utc_now_iso()
+    if detail:
+        return f"{timestamp} | {identity} | {operation} | {path or '-'} | {outcome} | {detail}"
+    return f"{timestamp} | {identity} | {operation} | {path or '-'} | {outcome}"
 
 
 def log_event(
@@ -18,7 +96,10 @@ def log_event(
     """Append a single audit log entry to the audit file.
 
     Each entry is one line of pipe-separated fields:
-    timestamp | identity | operation | path_or_dash | outcome [| detail]
+    prev_hash | timestamp | identity | operation | path_or_dash | outcome [| detail]
+
+    prev_hash is the first 16 hex digits of the SHA-256 of the previous
+    line (all zeros for the first entry); see verify_chain().
 
     Args:
         audit_file: Path to the audit log file.
@@ -28,13 +109,187 @@ def log_event(
         outcome: The outcome (success, denied, or error).
         detail: Optional additional context string.
     """
-    timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    path_str = path if path else "-"
-    line = f"{timestamp} | {identity} | {operation} | {path_str} | {outcome}"
-    if detail:
-        line += f" | {detail}"
-    with open(audit_file, "a") as f:
-        f.write(line + "\n")
+    body = _format_line(identity, operation, path, outcome, detail)
+    lines, _ = _chain_lines(_last_line_hash(audit_file), [body])
+    with open(audit_file, "a", encoding="utf-8") as f:
+        f.write(lines[0] + "\n")
+
+
+class AuditLogger:
+    """Append-only audit logger that keeps its file handle open.
+
+    The file is opened lazily on the first write, in line-buffered append
+    mode, so each entry reaches the OS before the caller returns while
+    avoiding an open/close pair per event. The hash of the last written
+    line is remembered; it is re-read from the file only if something
+    else appended to it in the meantime.
+
+    With buffer_size > 1, entries are held in memory instead and written
+    with a single write() once buffer_size entries are pending, after
+    flush_interval seconds (from a background timer), on flush()/close(),
+    or at interpreter exit. Entries still pending when the process is
+    killed are lost, so buffering is off by default.
+
+    With summary_interval set, successful events reported through
+    count_event() are not written one by one; each (identity, operation,
+    path) gets one summary entry per interval carrying the number of
+    events and the time of the first one. Like buffering, this trades
+    the per-event record (REQ-AUD-001) for less I/O and is off by default.
+
+    Args:
+        audit_file: Path to the audit log file.
+        buffer_size: Number of entries to collect before writing.
+        flush_interval: Maximum seconds a buffered entry waits for a write.
+        summary_interval: Seconds between summary entries, or None to log
+            every counted event individually.
+    """
+
+    def __init__(
+        self,
+        audit_file: str,
+        buffer_size: int = 1,
+        flush_interval: float = 0.05,
+        summary_interval: float | None = None,
+    ) -> None:
+        self.audit_file = audit_file
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.summary_interval = summary_interval
+        self._fh = None
+        self._last_hash: str | None = None
+        self._size = 0
+        self._pending: list[str] = []
+        self._lock = threading.Lock()
+        # Buffered entries and summaries are due on their own schedules
+        self._flush_timer: threading.Timer | None = None
+        self._summary_timer: threading.Timer | None = None
+        # (identity, operation, path) -> [count, timestamp of first event]
+        self._counts: dict[tuple, list] = {}
+        if buffer_size > 1 or summary_interval is not None:
+            atexit.register(self.close)
+
+    def _handle(self):
+        if self._fh is None:
+            self._fh = open(self.audit_file, "a", buffering=1, encoding="utf-8")
+        return self._fh
+
+    def _append(self, bodies: list[str]) -> None:
+        fh = self._handle()
+        if self._last_hash is None or os.fstat(fh.fileno()).st_size != self._size:
+            self._last_hash = _last_line_hash(self.audit_file)
+        lines, self._last_hash = _chain_lines(self._last_hash, bodies)
+        fh.write("\n".join(lines) + "\n")
+        self._size = os.fstat(fh.fileno()).st_size
+
+    def _submit(self, bodies: list[str]) -> None:
+        # Unbuffered writes take the lock too: the flush timer and other
+        # threads append through the same handle and chain hash
+        with self._lock:
+            if self.buffer_size <= 1:
+                self._append(bodies)
+                return
+            self._pending.extend(bodies)
+            if len(self._pending) >= self.buffer_size:
+                self._write_pending(summaries=False)
+            elif self._flush_timer is None:
+                self._flush_timer = _start_timer(self.flush_interval, self._flush_buffer)
+
+    def _flush_buffer(self) -> None:
+        # Flush timer: write buffered entries but leave summaries counting
+        with self._lock:
+            self._write_pending(summaries=False)
+
+    def _write_pending(self, summaries: bool = True) -> None:
+        # Caller holds self._lock. Summary entries are written only when
+        # their interval is up, or on flush()/close().
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        bodies, self._pending = self._pending, []
+        if summaries:
+            if self._summary_timer is not None:
+                self._summary_timer.cancel()
+                self._summary_timer = None
+            counts, self._counts = self._counts, {}
+            for (identity, operation, path), (count, since) in counts.items():
+                bodies.append(_format_line(
+                    identity, operation, path, "success", f"count={count} since={since}",
+                ))
+        if bodies:
+            self._append(bodies)
+
+    def log_event(
+        self,
+        identity: str,
+        operation: str,
+        path: str | None,
+        outcome: str,
+        detail: str | None = None,
+    ) -> None:
+        """Append a single audit log entry. See module-level log_event()."""
+        self._submit([_format_line(identity, operation, path, outcome, detail)])
+
+    def log_events(self, entries: list[tuple]) -> None:
+        """Append several entries with a single write.
+
+        Args:
+            entries: Tuples of (identity, operation, path, outcome[, detail]).
+        """
+        if not entries:
+            return
+        self._submit([_format_line(*entry) for entry in entries])
+
+    def count_event(self, identity: str, operation: str, path: str | None) -> None:
+        """Record a successful event, summarized if summary_interval is set.
+
+        Without a summary interval this is log_event(..., "success").
+        """
+        if self.summary_interval is None:
+            self.log_event(identity, operation, path, "success")
+            return
+        key = (identity, operation, path)
+        with self._lock:
+            entry = self._counts.get(key)
+            if entry is None:
+                self._counts[key] = [1, utc_now_iso()]
+            else:
+                entry[0] += 1
+            if self._summary_timer is None:
+                self._summary_timer = _start_timer(self.summary_interval, self.flush)
+
+    def count_events(self, entries: list[tuple[str, str, str | None]]) -> None:
+        """Record several successful events; see count_event().
+
+        Args:
+            entries: Tuples of (identity, operation, path).
+        """
+        if self.summary_interval is None:
+            self.log_events([(*entry, "success") for entry in entries])
+            return
+        for entry in entries:
+            self.count_event(*entry)
+
+    def flush(self) -> None:
+        """Write any buffered entries and flush them to the OS."""
+        with self._lock:
+            self._write_pending()
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self) -> None:
+        """Write any buffered entries and close the underlying file handle."""
+        with self._lock:
+            self._write_pending()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def _start_timer(delay: float, callback) -> threading.Timer:
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+    return timer
 
 
 def read_log(audit_file: str, last_n: int | None = None) -> list[str]:
@@ -50,25 +305,114 @@ def read_log(audit_file: str, last_n: int | None = None) -> list[str]:
     Raises:
         FileNotFoundError: If the audit file does not exist.
     """
-    if not Path(audit_file).exists():
+    if not os.path.exists(audit_file):
         raise FileNotFoundError(f"Audit log file not found at {audit_file}")
-    with open(audit_file, "r") as f:
-        lines = [line.rstrip() for line in f if line.strip()]
     if last_n is not None and last_n > 0:
-        lines = lines[-last_n:]
+        return _read_tail(audit_file, last_n)
+    lines: list[str] = []
+    append = lines.append
+    with open(audit_file, "r") as f:
+        for line in f:
+            line = line.rstrip()
+            if line:
+                append(line)
     return lines
 
 
+def _read_tail(audit_file: str, last_n: int) -> list[str]:
+    """Return the last N non-empty entries by reading backwards from EOF.
+
+    Blocks are read from the end of the file until enough complete lines
+    have been seen. Each block is split once and only the line spanning
+    a block boundary is carried over, so the cost is linear in the tail
+    size rather than in the whole log.
+
+    Args:
+        audit_file: Path to the audit log file.
+        last_n: Number of entries to return (must be positive).
+
+    Returns:
+        List of raw line strings (one per entry).
+    """
+    found: list[str] = []  # newest first
+    # Pieces of the line straddling the start of what has been read, newest first
+    head: list[bytes] = []
+
+    def add(raw: bytes) -> None:
+        line = raw.decode("utf-8").rstrip()
+        if line:
+            found.append(line)
+
+    with open(audit_file, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and len(found) < last_n:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            parts = f.read(step).split(b"\n")
+            if len(parts) == 1:
+                head.append(parts[0])
+                continue
+            head.append(parts[-1])
+            add(b"".join(reversed(head)))
+            for raw in reversed(parts[1:-1]):
+                add(raw)
+            head = [parts[0]]
+    # At BOF the remaining fragment is a complete first line
+    if len(found) < last_n:
+        add(b"".join(reversed(head)))
+
+    found = found[:last_n]
+    found.reverse()
+    return found
+
+
+def verify_chain(audit_file: str) -> tuple[int, int | None]:
+    """Check the hash chain of the audit file.
+
+    Entries written before hash chaining was introduced carry no chain
+    field; they are accepted only as a leading run before the first
+    chained entry. Every chained entry must carry the hash of the line
+    immediately before it, and once one has been seen, a later entry
+    without the field (e.g. one whose prefix was stripped) breaks the chain.
+
+    Args:
+        audit_file: Path to the audit log file.
+
+    Returns:
+        Tuple of (number of entries, 1-based index of the first entry whose
+        chain field does not match, or None if the chain is intact).
+
+    Raises:
+        FileNotFoundError: If the audit file does not exist.
+    """
+    lines = read_log(audit_file)
+    prev_hash = _GENESIS_HASH
+    chained = False
+    for index, line in enumerate(lines, start=1):
+        m = _CHAIN_RE.match(line)
+        if m is None:
+            if chained:
+                return len(lines), index
+        elif m.group(1) != prev_hash:
+            return len(lines), index
+        else:
+            chained = True
+        prev_hash = _hash_line(line)
+    return len(lines), None
+
+
 def format_entry(entry_line: str) -> str:
     """Format a raw log line for display.
 
-    The pipe-separated format is already human-readable, so this passes
-    through unchanged.
+    The chain hash is dropped; the remaining pipe-separated fields are
+    already human-readable.
 
     Args:
         entry_line: A raw audit log line.
 
     Returns:
-        The formatted line (unchanged).
+        The line without its leading chain field.
     """
-    return entry_line
+    m = _CHAIN_RE.match(entry_line)
+    return entry_line[m.end():] if m is not None else entry_line
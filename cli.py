@@ -4,49 +4,62 @@
 # Fulfills: REQ-CLI-001 through REQ-CLI-006
 
 import argparse
-import getpass
 import sys
 
-from vault import Vault, VaultError
 
+def _prompt_password() -> str:
+    """Prompt interactively for the master password."""
+    import getpass
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build and return the argparse parser with all subcommands.
+    return getpass.getpass("Master password: ")
 
-    Subcommands: init, unseal, seal, status, put, get, delete, list,
-    add-policy, remove-policy, audit-log.
 
-    Returns:
-        Configured ArgumentParser instance.
-    """
-    parser = argparse.ArgumentParser(
-        prog="vault",
-        description="Secret Management Vault",
-    )
-    subparsers = parser.add_subparsers(dest="command")
-
-    # -- init --
+def _build_init(subparsers) -> None:
     p_init = subparsers.add_parser("init", help="Initialize a new vault")
     p_init.add_argument("--vault-file", default="vault.enc")
     p_init.add_argument("--audit-file", default="audit.log")
     p_init.add_argument("--password", default=None)
+    p_init.add_argument(
+        "--iterations", type=int, default=600000,
+        help="PBKDF2 iterations (minimum and default: 600000)",
+    )
+    p_init.add_argument(
+        "--kdf-hash", choices=("sha256", "sha512"), default="sha256",
+        help="PBKDF2 hash function (default: sha256)",
+    )
+
+
+def _build_bootstrap(subparsers) -> None:
+    p_boot = subparsers.add_parser(
+        "bootstrap", help="Initialize, unseal, and add a first policy in one step",
+    )
+    p_boot.add_argument("--vault-file", default="vault.enc")
+    p_boot.add_argument("--audit-file", default="audit.log")
+    p_boot.add_argument("--password", default=None)
+    p_boot.add_argument("--identity", required=True)
+    p_boot.add_argument("--path-pattern", required=True)
+    p_boot.add_argument("--capabilities", required=True, help="Comma-separated capabilities")
+
 
-    # -- unseal --
+def _build_unseal(subparsers) -> None:
     p_unseal = subparsers.add_parser("unseal", help="Unseal the vault")
     p_unseal.add_argument("--vault-file", default="vault.enc")
     p_unseal.add_argument("--audit-file", default="audit.log")
     p_unseal.add_argument("--password", default=None)
 
-    # -- seal --
+
+def _build_seal(subparsers) -> None:
     p_seal = subparsers.add_parser("seal", help="Seal the vault")
     p_seal.add_argument("--vault-file", default="vault.enc")
     p_seal.add_argument("--audit-file", default="audit.log")
 
-    # -- status --
+
+def _build_status(subparsers) -> None:
     p_status = subparsers.add_parser("status", help="Show vault status")
     p_status.add_argument("--vault-file", default="vault.enc")
 
-    # -- put --
+
+def _build_put(subparsers) -> None:
     p_put = subparsers.add_parser("put", help="Store or update a secret")
     p_put.add_argument("path", help="Secret path (e.g., production/db/password)")
     p_put.add_argument("value", help="Secret value")
@@ -54,7 +67,21 @@ def build_parser() -> argparse.ArgumentParser:
     p_put.add_argument("--vault-file", default="vault.enc")
     p_put.add_argument("--audit-file", default="audit.log")
 
-    # -- get --
+
+def _build_put_batch(subparsers) -> None:
+    p_put_batch = subparsers.add_parser(
+        "put-batch", help="Store or update many secrets from a JSON Lines file",
+    )
+    p_put_batch.add_argument(
+        "--file", required=True,
+        help='JSON Lines file, one {"path": ..., "value": ...} object per line',
+    )
+    p_put_batch.add_argument("--identity", required=True)
+    p_put_batch.add_argument("--vault-file", default="vault.enc")
+    p_put_batch.add_argument("--audit-file", default="audit.log")
+
+
+def _build_get(subparsers) -> None:
     p_get = subparsers.add_parser("get", help="Retrieve a secret")
     p_get.add_argument("path", help="Secret path")
     p_get.add_argument("--identity", required=True)
@@ -62,21 +89,24 @@ def build_parser() -> argparse.ArgumentParser:
     p_get.add_argument("--vault-file", default="vault.enc")
     p_get.add_argument("--audit-file", default="audit.log")
 
-    # -- delete --
+
+def _build_delete(subparsers) -> None:
     p_delete = subparsers.add_parser("delete", help="Delete a secret")
     p_delete.add_argument("path", help="Secret path")
     p_delete.add_argument("--identity", required=True)
     p_delete.add_argument("--vault-file", default="vault.enc")
     p_delete.add_argument("--audit-file", default="audit.log")
 
-    # -- list --
+
+def _build_list(subparsers) -> None:
     p_list = subparsers.add_parser("list", help="List secrets by prefix")
     p_list.add_argument("prefix", nargs="?", default="", help="Path prefix filter")
     p_list.add_argument("--identity", required=True)
     p_list.add_argument("--vault-file", default="vault.enc")
     p_list.add_argument("--audit-file", default="audit.log")
 
-    # -- add-policy --
+
+def _build_add_policy(subparsers) -> None:
     p_add_pol = subparsers.add_parser("add-policy", help="Add an access control policy")
     p_add_pol.add_argument("--identity", required=True)
     p_add_pol.add_argument("--path-pattern", required=True)
@@ -84,42 +114,179 @@ def build_parser() -> argparse.ArgumentParser:
     p_add_pol.add_argument("--vault-file", default="vault.enc")
     p_add_pol.add_argument("--audit-file", default="audit.log")
 
-    # -- remove-policy --
+
+def _build_remove_policy(subparsers) -> None:
     p_rm_pol = subparsers.add_parser("remove-policy", help="Remove an access control policy")
     p_rm_pol.add_argument("--identity", required=True)
     p_rm_pol.add_argument("--path-pattern", required=True)
     p_rm_pol.add_argument("--vault-file", default="vault.enc")
     p_rm_pol.add_argument("--audit-file", default="audit.log")
 
-    # -- audit-log --
+
+def _build_audit_log(subparsers) -> None:
     p_audit = subparsers.add_parser("audit-log", help="View audit log entries")
     p_audit.add_argument("--audit-file", default="audit.log")
     p_audit.add_argument("--last", type=int, default=None)
 
+
+def _build_verify_audit(subparsers) -> None:
+    p_verify = subparsers.add_parser("verify-audit", help="Verify the audit log hash chain")
+    p_verify.add_argument("--audit-file", default="audit.log")
+
+
+# Subcommand name -> builder, in the order shown by --help.
+_SUBCOMMAND_BUILDERS = {
+    "init": _build_init,
+    "bootstrap": _build_bootstrap,
+    "unseal": _build_unseal,
+    "seal": _build_seal,
+    "status": _build_status,
+    "put": _build_put,
+    "put-batch": _build_put_batch,
+    "get": _build_get,
+    "delete": _build_delete,
+    "list": _build_list,
+    "add-policy": _build_add_policy,
+    "remove-policy": _build_remove_policy,
+    "audit-log": _build_audit_log,
+    "verify-audit": _build_verify_audit,
+}
+
+
+def _read_batch_file(batch_file: str, identity: str) -> list[tuple[str, str, str]]:
+    """Parse a put-batch JSON Lines file into (path, value, identity) tuples.
+
+    Blank lines are skipped.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If a line is not a JSON object with string "path" and
+            "value" fields.
+    """
+    import json
+
+    items = []
+    with open(batch_file, "r") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict):
+                raise ValueError(f"line {lineno}: expected a JSON object")
+            path, value = entry.get("path"), entry.get("value")
+            if not isinstance(path, str) or not isinstance(value, str):
+                raise ValueError(f'line {lineno}: "path" and "value" must be strings')
+            items.append((path, value, identity))
+    return items
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if it cannot be determined.
+
+    Only the first non-flag token is considered. A top-level -h/--help
+    before it means the full command list is wanted, so None is returned.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        The subcommand name, or None.
+    """
+    for token in argv:
+        if token in ("-h", "--help"):
+            return None
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Build and return the argparse parser.
+
+    Only the subparser for the subcommand named in argv is constructed.
+    When no known subcommand can be identified (e.g. top-level --help,
+    no arguments, or an unknown command), all subcommands are built so
+    that help and error messages list every choice.
+
+    Subcommands: init, bootstrap, unseal, seal, status, put, put-batch, get,
+    delete, list, add-policy, remove-policy, audit-log, verify-audit.
+
+    Args:
+        argv: Command-line arguments to sniff. Defaults to sys.argv[1:].
+
+    Returns:
+        Configured ArgumentParser instance.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog="vault",
+        description="Secret Management Vault",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    command = _sniff_subcommand(argv)
+    if command is not None:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+
     return parser
 
 
-def main() -> None:
-    """Entry point. Parse arguments, dispatch to Vault methods, format output."""
-    parser = build_parser()
-    args = parser.parse_args()
+def main(argv: list[str] | None = None) -> None:
+    """Entry point. Parse arguments, dispatch to Vault methods, format output.
+
+    Args:
+        argv: Command-line arguments. Defaults to sys.argv[1:].
+    """
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    # status only checks which files exist, so it is answered from storage
+    # alone (mirroring Vault.status) without loading the crypto stack
+    if args.command == "status":
+        import storage
+        if not storage.vault_file_exists(args.vault_file):
+            print(f"Error: Vault file not found at {args.vault_file}", file=sys.stderr)
+            sys.exit(1)
+        sealed = not storage.session_file_exists(args.vault_file + storage.SESSION_SUFFIX)
+        print(f"Status: {'sealed' if sealed else 'unsealed'}")
+        return
+
+    # Deferred import: vault pulls in the cryptography backend, which
+    # --help, status and argparse usage errors never need.
+    from vault import Vault, VaultError
+
+    v = None
     try:
         if args.command == "init":
             password = args.password
             if password is None:
-                password = getpass.getpass("Master password: ")
+                password = _prompt_password()
+            v = Vault(args.vault_file, args.audit_file)
+            print(v.init_vault(password, args.iterations, args.kdf_hash))
+
+        elif args.command == "bootstrap":
+            password = args.password
+            if password is None:
+                password = _prompt_password()
+            caps = [c.strip() for c in args.capabilities.split(",")]
             v = Vault(args.vault_file, args.audit_file)
             print(v.init_vault(password))
+            print(v.unseal(password))
+            print(v.add_policy(args.identity, args.path_pattern, caps))
 
         elif args.command == "unseal":
             password = args.password
             if password is None:
-                password = getpass.getpass("Master password: ")
+                password = _prompt_password()
             v = Vault(args.vault_file, args.audit_file)
             print(v.unseal(password))
 
@@ -127,15 +294,19 @@ def main() -> None:
             v = Vault(args.vault_file, args.audit_file)
             print(v.seal())
 
-        elif args.command == "status":
-            v = Vault(args.vault_file)
-            result = v.status()
-            print(f"Status: {result}")
-
         elif args.command == "put":
             v = Vault(args.vault_file, args.audit_file)
             print(v.put_secret(args.path, args.value, args.identity))
 
+        elif args.command == "put-batch":
+            try:
+                items = _read_batch_file(args.file, args.identity)
+            except (OSError, ValueError) as e:
+                raise VaultError(f"Cannot read batch file {args.file}: {e}")
+            v = Vault(args.vault_file, args.audit_file)
+            for message in v.put_secrets_batch(items):
+                print(message)
+
         elif args.command == "get":
             v = Vault(args.vault_file, args.audit_file)
             r = v.get_secret(args.path, args.identity, args.version)
@@ -171,9 +342,16 @@ def main() -> None:
             for line in lines:
                 print(line)
 
+        elif args.command == "verify-audit":
+            v = Vault(audit_file=args.audit_file)
+            print(v.verify_audit_log())
+
     except VaultError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if v is not None:
+            v.close()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,24 @@
 # and random byte generation.
 # Fulfills: REQ-SEAL-002, REQ-ENC-001, REQ-ENC-002, REQ-ENC-003, REQ-ENC-005
 
+import hashlib
 import os
+import secrets
 
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives.hashes import SHA256
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+
+# REQ-SEAL-002: PBKDF2 work factor floor; init may choose a higher value
+MIN_PBKDF2_ITERATIONS = 600000
+
+# AES-256 key and AES-GCM nonce sizes in bytes
+DEK_SIZE = 32
+NONCE_SIZE = 12
+
+# Hash functions init may choose for PBKDF2; the choice is stored in the vault file
+PBKDF2_HASHES = ("sha256", "sha512")
+DEFAULT_PBKDF2_HASH = "sha256"
 
 
 class DecryptionError(Exception):
@@ -16,50 +28,67 @@ class DecryptionError(Exception):
     pass
 
 
-def derive_root_key(password: str, salt: bytes, iterations: int) -> bytes:
-    """Derive a 256-bit root key from a master password using PBKDF2-HMAC-SHA256.
+def derive_root_key(
+    password: str,
+    salt: bytes,
+    iterations: int,
+    hash_name: str = DEFAULT_PBKDF2_HASH,
+) -> bytes:
+    """Derive a 256-bit root key from a master password using PBKDF2-HMAC.
+
+    Uses hashlib.pbkdf2_hmac, which runs the whole iteration loop in
+    OpenSSL.
 
     Args:
         password: The master password string.
         salt: A 16-byte random salt.
         iterations: Number of PBKDF2 iterations (minimum 600,000).
+        hash_name: HMAC hash function, one of PBKDF2_HASHES.
 
     Returns:
         32 bytes (256-bit key).
     """
-    kdf = PBKDF2HMAC(
-        algorithm=SHA256(),
-        length=32,
-        salt=salt,
-        iterations=iterations,
-    )
-    return kdf.derive(password.encode("utf-8"))
+    return hashlib.pbkdf2_hmac(hash_name, password.encode("utf-8"), salt, iterations, dklen=32)
 
 
-def encrypt_aes_gcm(key: bytes, plaintext: bytes) -> tuple[bytes, bytes]:
-    """Encrypt plaintext with AES-256-GCM using the given 32-byte key.
+def aes_gcm_cipher(key: bytes) -> AESGCM:
+    """Build a reusable AES-256-GCM cipher for the given 32-byte key.
 
-    Generates a random 12-byte nonce internally. The returned ciphertext
-    includes the 16-byte GCM authentication tag appended by the library.
+    Use with encrypt_with()/decrypt_with() when the same key protects many
+    values (e.g. the root key across a batch of DEKs).
 
     Args:
         key: A 32-byte AES-256 key.
+
+    Returns:
+        An AESGCM instance bound to the key.
+    """
+    return AESGCM(key)
+
+
+def encrypt_with(aesgcm: AESGCM, plaintext: bytes, nonce: bytes | None = None) -> tuple[bytes, bytes]:
+    """Encrypt plaintext with a prebuilt AES-GCM cipher and a fresh random nonce.
+
+    Args:
+        aesgcm: Cipher from aes_gcm_cipher().
         plaintext: The data to encrypt.
+        nonce: A fresh random 12-byte nonce drawn by the caller (e.g. from
+            generate_key_material()); generated here if omitted. Must never
+            be reused with the same key.
 
     Returns:
         A tuple of (nonce, ciphertext) where nonce is 12 bytes.
     """
-    nonce = os.urandom(12)
-    aesgcm = AESGCM(key)
-    ciphertext = aesgcm.encrypt(nonce, plaintext, None)
-    return (nonce, ciphertext)
+    if nonce is None:
+        nonce = secrets.token_bytes(NONCE_SIZE)
+    return (nonce, aesgcm.encrypt(nonce, plaintext, None))
 
 
-def decrypt_aes_gcm(key: bytes, nonce: bytes, ciphertext: bytes) -> bytes:
-    """Decrypt ciphertext with AES-256-GCM using the given key and nonce.
+def decrypt_with(aesgcm: AESGCM, nonce: bytes, ciphertext: bytes) -> bytes:
+    """Decrypt ciphertext with a prebuilt AES-GCM cipher.
 
     Args:
-        key: A 32-byte AES-256 key.
+        aesgcm: Cipher from aes_gcm_cipher().
         nonce: The 12-byte nonce used during encryption.
         ciphertext: The ciphertext including the GCM auth tag.
 
@@ -69,13 +98,47 @@ def decrypt_aes_gcm(key: bytes, nonce: bytes, ciphertext: bytes) -> bytes:
     Raises:
         DecryptionError: If authentication fails (wrong key or tampered data).
     """
-    aesgcm = AESGCM(key)
     try:
         return aesgcm.decrypt(nonce, ciphertext, None)
     except InvalidTag:
         raise DecryptionError("Decryption failed: invalid key or tampered data")
 
 
+def encrypt_aes_gcm(key: bytes, plaintext: bytes, nonce: bytes | None = None) -> tuple[bytes, bytes]:
+    """Encrypt plaintext with AES-256-GCM using the given 32-byte key.
+
+    Generates a random 12-byte nonce internally unless one is passed. The
+    returned ciphertext includes the 16-byte GCM authentication tag
+    appended by the library.
+
+    Args:
+        key: A 32-byte AES-256 key.
+        plaintext: The data to encrypt.
+        nonce: Optional caller-drawn random 12-byte nonce; see encrypt_with().
+
+    Returns:
+        A tuple of (nonce, ciphertext) where nonce is 12 bytes.
+    """
+    return encrypt_with(AESGCM(key), plaintext, nonce)
+
+
+def decrypt_aes_gcm(key: bytes, nonce: bytes, ciphertext: bytes) -> bytes:
+    """Decrypt ciphertext with AES-256-GCM using the given key and nonce.
+
+    Args:
+        key: A 32-byte AES-256 key.
+        nonce: The 12-byte nonce used during encryption.
+        ciphertext: The ciphertext including the GCM auth tag.
+
+    Returns:
+        The decrypted plaintext bytes.
+
+    Raises:
+        DecryptionError: If authentication fails (wrong key or tampered data).
+    """
+    return decrypt_with(AESGCM(key), nonce, ciphertext)
+
+
 def generate_salt() -> bytes:
     """Generate a random 16-byte salt for PBKDF2.
 
@@ -91,4 +154,29 @@ def generate_dek() -> bytes:
     Returns:
         32 random bytes.
     """
-    return os.urandom(32)
+    return os.urandom(DEK_SIZE)
+
+
+def generate_key_material(count: int) -> list[tuple[bytes, bytes, bytes]]:
+    """Generate DEKs and nonces for count envelope encryptions at once.
+
+    Draws all random bytes with a single os.urandom() call and slices them.
+
+    Args:
+        count: Number of values to be encrypted.
+
+    Returns:
+        A list of (dek, value_nonce, dek_nonce) tuples: a 32-byte DEK and
+        two 12-byte nonces per value.
+    """
+    step = DEK_SIZE + 2 * NONCE_SIZE
+    pool = os.urandom(step * count)
+    material = []
+    for offset in range(0, step * count, step):
+        dek_end = offset + DEK_SIZE
+        material.append((
+            pool[offset:dek_end],
+            pool[dek_end:dek_end + NONCE_SIZE],
+            pool[dek_end + NONCE_SIZE:offset + step],
+        ))
+    return material
@@ -1,28 +1,37 @@
 # demo.py - Narrated demonstration of the Secret Management Vault
 # Uses fresh data different from the validation suite
+# Commands run in-process through cli.main() rather than one interpreter each
+import contextlib
+import io
 import os
-import subprocess
 import sys
 import tempfile
 import shutil
 
-ROOT = os.path.dirname(os.path.abspath(__file__))
-CLI = os.path.join(ROOT, "cli.py")
+import cli
 
 
 def run(args, expect_fail=False):
     cmd_str = "python cli.py " + " ".join(args)
     print("  $ %s" % cmd_str)
-    r = subprocess.run(
-        [sys.executable, CLI] + args,
-        capture_output=True, text=True, cwd=ROOT
-    )
-    if r.stdout.strip():
-        print("  %s" % r.stdout.strip())
-    if r.stderr.strip():
-        print("  %s" % r.stderr.strip())
+    out, err = io.StringIO(), io.StringIO()
+    old_argv = sys.argv
+    sys.argv = ["cli.py"] + args
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                cli.main()
+                code = 0
+            except SystemExit as e:
+                code = e.code or 0
+    finally:
+        sys.argv = old_argv
+    if out.getvalue().strip():
+        print("  %s" % out.getvalue().strip())
+    if err.getvalue().strip():
+        print("  %s" % err.getvalue().strip())
     print()
-    return r.returncode, r.stdout.strip(), r.stderr.strip()
+    return code, out.getvalue().strip(), err.getvalue().strip()
 
 
 def banner(text):
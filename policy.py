@@ -4,9 +4,16 @@
 # Fulfills: REQ-ACL-001, REQ-ACL-002, REQ-ACL-003, REQ-ACL-004, REQ-ACL-005,
 #           REQ-ACL-006, REQ-CRUD-007
 
+import functools
 import re
+from collections.abc import Callable
 
-VALID_CAPABILITIES: list[str] = ["read", "write", "list", "delete"]
+VALID_CAPABILITIES: frozenset[str] = frozenset({"read", "write", "list", "delete"})
+
+_PATH_RE = re.compile(r"\A[a-zA-Z0-9_-]+(?:/[a-zA-Z0-9_-]+)*\Z")
+
+# identity -> [(path_pattern, capabilities, compiled matcher)] in definition order
+PolicyIndex = dict[str, list[tuple[str, frozenset[str], Callable[[str], bool]]]]
 
 
 def validate_path(path: str) -> bool:
@@ -22,9 +29,7 @@ def validate_path(path: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    if not path:
-        return False
-    return bool(re.fullmatch(r"[a-zA-Z0-9_-]+(/[a-zA-Z0-9_-]+)*", path))
+    return bool(path) and _PATH_RE.match(path) is not None
 
 
 def validate_capabilities(capabilities: list[str]) -> str | None:
@@ -36,10 +41,7 @@ def validate_capabilities(capabilities: list[str]) -> str | None:
     Returns:
         The first invalid capability string, or None if all are valid.
     """
-    for cap in capabilities:
-        if cap not in VALID_CAPABILITIES:
-            return cap
-    return None
+    return next((cap for cap in capabilities if cap not in VALID_CAPABILITIES), None)
 
 
 def match_path_pattern(pattern: str, path: str) -> bool:
@@ -56,9 +58,37 @@ def match_path_pattern(pattern: str, path: str) -> bool:
     Returns:
         True if the path matches the pattern.
     """
+    return _compile_pattern(pattern)(path)
+
+
+def _match_all(path: str) -> bool:
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Build a predicate that tests paths against a glob pattern (cached per pattern).
+
+    The common shapes are specialized so they avoid the regex engine:
+    "**" matches everything, "<literal>/**" is a prefix test, and a
+    pattern without wildcards is an equality test. Anything else is
+    translated to a compiled regex.
+
+    Args:
+        pattern: The glob pattern.
+
+    Returns:
+        A callable taking a path and returning True if it matches.
+    """
     # Special case: "**" matches everything including empty string
     if pattern == "**":
-        return True
+        return _match_all
+    if "*" not in pattern:
+        return pattern.__eq__
+    if pattern.endswith("/**") and "*" not in pattern[:-3]:
+        # "a/b/**" matches "a/b/" followed by anything
+        prefix = pattern[:-2]
+        return lambda path: path.startswith(prefix)
 
     # Split pattern on "**" to handle multi-segment wildcards first
     parts = pattern.split("**")
@@ -72,23 +102,78 @@ def match_path_pattern(pattern: str, path: str) -> bool:
         regex_parts.append("[^/]*".join(escaped_segments))
 
     # Join the "**"-separated parts with ".*" (match anything including slashes)
-    full_regex = ".*".join(regex_parts)
+    fullmatch = re.compile(".*".join(regex_parts)).fullmatch
+    return lambda path: fullmatch(path) is not None
+
+
+# Pre-populate the cache with the universal patterns
+for _pattern in ("**", "*"):
+    _compile_pattern(_pattern)
+del _pattern
+
 
-    return bool(re.fullmatch(full_regex, path))
+def build_policy_index(policies: list[dict]) -> PolicyIndex:
+    """Group policies by identity for per-identity access checks.
+
+    Each pattern is compiled once here, so access checks call the stored
+    matcher directly.
+
+    Args:
+        policies: List of policy dicts with keys: identity, path_pattern, capabilities.
+
+    Returns:
+        Dict mapping each identity to a list of (path_pattern, capabilities,
+        matcher) tuples, in the order the policies were defined.
+    """
+    index: PolicyIndex = {}
+    for pol in policies:
+        index_policy(index, pol)
+    return index
+
+
+def index_policy(policy_index: PolicyIndex, pol: dict) -> None:
+    """Add one policy to a policy index in place (after any existing entries).
+
+    Args:
+        policy_index: Policies grouped by identity, from build_policy_index().
+        pol: Policy dict with keys: identity, path_pattern, capabilities.
+    """
+    pattern = pol["path_pattern"]
+    policy_index.setdefault(pol["identity"], []).append(
+        (pattern, frozenset(pol["capabilities"]), _compile_pattern(pattern))
+    )
+
+
+def reindex_identity(policy_index: PolicyIndex, policies: list[dict], identity: str) -> None:
+    """Rebuild one identity's entries in a policy index from the policies list.
+
+    Used after a removal, which may reorder the list: rebuilding from the
+    list keeps the index holding exactly the policies that remain.
+
+    Args:
+        policy_index: Policies grouped by identity, from build_policy_index().
+        policies: The current list of policy dicts.
+        identity: The identity whose entries to rebuild.
+    """
+    policy_index.pop(identity, None)
+    for pol in policies:
+        if pol["identity"] == identity:
+            index_policy(policy_index, pol)
 
 
 def check_access(
-    policies: list[dict],
+    policy_index: PolicyIndex,
     identity: str,
     path: str,
     capability: str,
 ) -> bool:
     """Return True if at least one policy grants the capability to the identity on the path.
 
-    Default deny: returns False if no policy grants access.
+    Default deny: returns False if no policy grants access. Only the
+    policies of the given identity are examined.
 
     Args:
-        policies: List of policy dicts with keys: identity, path_pattern, capabilities.
+        policy_index: Policies grouped by identity, from build_policy_index().
         identity: The caller's identity string.
         path: The target secret path.
         capability: The required capability (read, write, list, or delete).
@@ -96,8 +181,7 @@ def check_access(
     Returns:
         True if access is granted, False otherwise.
     """
-    for pol in policies:
-        if pol["identity"] == identity and capability in pol["capabilities"]:
-            if match_path_pattern(pol["path_pattern"], path):
-                return True
+    for _path_pattern, capabilities, matches in policy_index.get(identity, ()):
+        if capability in capabilities and matches(path):
+            return True
     return False
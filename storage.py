@@ -4,11 +4,34 @@
 # Fulfills: REQ-SEAL-003, REQ-CRUD-008, REQ-ACL-008, REQ-ENC-004
 
 import base64
-import copy
 import json
 import os
 import tempfile
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+# Durability policies for save_vault: fsync on every write, never, or on
+# every FSYNC_EVERY_N-th write within this process.
+FSYNC_POLICIES = ("always", "never", "every_n")
+FSYNC_EVERY_N = 32
+_writes_since_fsync = 0
+
+# Root key length held in the session file, kept next to the vault file
+SESSION_KEY_SIZE = 32
+SESSION_SUFFIX = ".session"
+
+# Change log kept next to the vault file (see append_changes); save_vault
+# folds it back into the vault file
+WAL_SUFFIX = ".wal"
+WAL_COMPACT_BYTES = 4 * 1024 * 1024
+
+# Binary fields decoded from base64 back to bytes on load; version fields
+# are decoded only when a version is read (see decode_version)
+_TOP_BIN = ("salt", "verification_nonce", "verification_token")
+_VER_BIN = ("encrypted_dek", "dek_nonce", "encrypted_value", "value_nonce")
 
 
 def vault_file_exists(vault_file: str) -> bool:
@@ -20,103 +43,327 @@ def vault_file_exists(vault_file: str) -> bool:
     Returns:
         True if file exists, False otherwise.
     """
-    return Path(vault_file).exists()
+    return os.path.exists(vault_file)
+
+
+def _encode_bytes(obj: object) -> str:
+    """JSON serializer hook that base64-encodes bytes values."""
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize obj to compact JSON bytes, base64-encoding bytes values."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_encode_bytes)
+    return json.dumps(obj, default=_encode_bytes, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> object:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _should_fsync(fsync_policy: str) -> bool:
+    """Apply fsync_policy to one write and return whether to fsync it.
+
+    Raises:
+        ValueError: If fsync_policy is not recognized.
+    """
+    global _writes_since_fsync
+    if fsync_policy not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy '{fsync_policy}'")
 
+    if fsync_policy == "always":
+        return True
+    if fsync_policy == "every_n":
+        _writes_since_fsync += 1
+        if _writes_since_fsync >= FSYNC_EVERY_N:
+            _writes_since_fsync = 0
+            return True
+    return False
 
-def save_vault(vault_data: dict, vault_file: str) -> None:
+
+def _fsync_dir(dir_name: str) -> None:
+    """Flush a directory entry so a completed rename survives a crash (POSIX only)."""
+    if os.name != "posix":
+        return
+    dir_fd = os.open(dir_name, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def save_vault(vault_data: dict, vault_file: str, fsync_policy: str = "always") -> None:
     """Serialize vault_data to JSON and write it to vault_file.
 
-    Binary fields (bytes) are base64-encoded before serialization.
-    Writes to a temp file first, then renames for atomicity.
+    Binary fields (bytes) are base64-encoded by the serializer as they are
+    emitted, so vault_data is neither copied nor modified.
+    Writes to a temp file first, then renames for atomicity. Depending on
+    fsync_policy, the temp file and the containing directory are fsynced
+    so the new contents are durable once this returns. Only after that is
+    the change log (see append_changes) removed, since vault_data
+    includes it.
 
     Args:
         vault_data: The vault data dictionary with bytes fields.
         vault_file: Path to write the vault file.
-    """
-    data = copy.deepcopy(vault_data)
+        fsync_policy: One of FSYNC_POLICIES. "always" (default) syncs every
+            write, "never" leaves flushing to the OS, and "every_n" syncs
+            every FSYNC_EVERY_N-th write (for bulk imports).
 
-    # Encode top-level binary fields
-    for field in ("salt", "verification_nonce", "verification_token"):
-        if field in data and isinstance(data[field], bytes):
-            data[field] = base64.b64encode(data[field]).decode("ascii")
+    Raises:
+        ValueError: If fsync_policy is not recognized.
+    """
+    do_fsync = _should_fsync(fsync_policy)
 
-    # Encode binary fields in secret versions
-    for secret in data.get("secrets", {}).values():
-        for version in secret.get("versions", []):
-            for field in ("encrypted_dek", "dek_nonce", "encrypted_value", "value_nonce"):
-                if field in version and isinstance(version[field], bytes):
-                    version[field] = base64.b64encode(version[field]).decode("ascii")
+    # Compact output: the vault file is machine-read only
+    payload = _dumps(vault_data)
 
     # Write to temp file then rename for atomicity
     dir_name = os.path.dirname(os.path.abspath(vault_file))
     fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if do_fsync:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp_path, vault_file)
     except Exception:
         # Clean up temp file on failure
         if os.path.exists(tmp_path):
             os.remove(tmp_path)
         raise
+    # Make the rename durable before dropping the change log: otherwise a
+    # crash could keep the unlink but lose the rename, and with it every
+    # change since the last compaction
+    if do_fsync:
+        _fsync_dir(dir_name)
+    # Records up to vault_data["wal_seq"] are now in the vault file; a
+    # leftover log after a crash here is skipped on replay
+    try:
+        os.unlink(vault_file + WAL_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+
+def append_changes(
+    vault_data: dict,
+    vault_file: str,
+    changes: list[dict],
+    fsync_policy: str = "always",
+) -> int:
+    """Record changes already applied to vault_data in the vault's change log.
+
+    Appends one JSON line per change to vault_file + WAL_SUFFIX instead of
+    rewriting the whole vault file; load_vault() replays the log. Each
+    record gets the next sequence number, which is also stored in
+    vault_data["wal_seq"] so a later save_vault() marks it as applied.
+
+    Supported changes:
+    - {"op": "put", "path": str, "version": version_dict}
+    - {"op": "delete", "path": str}
+    - {"op": "add_policy", "policy": policy_dict}
+    - {"op": "remove_policy", "identity": str, "path_pattern": str}
+
+    Args:
+        vault_data: The vault data dictionary the changes were applied to.
+        vault_file: Path to the vault file.
+        changes: Change records, in the order they were applied.
+        fsync_policy: One of FSYNC_POLICIES; see save_vault().
+
+    Returns:
+        The size of the change log in bytes after the append.
+
+    Raises:
+        ValueError: If fsync_policy is not recognized.
+    """
+    do_fsync = _should_fsync(fsync_policy)
+    seq = vault_data.get("wal_seq", 0)
+    lines = []
+    for change in changes:
+        seq += 1
+        lines.append(_dumps({"seq": seq, **change}))
+    vault_data["wal_seq"] = seq
+
+    payload = b"\n".join(lines) + b"\n"
+
+    # One write() per batch of changes: no buffered file object, and the
+    # new size is computed rather than re-read
+    fd = os.open(vault_file + WAL_SUFFIX, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        size = os.fstat(fd).st_size
+        # Keep records on their own lines after a torn write
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            payload = b"\n" + payload
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if do_fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    if do_fsync and size == 0:
+        _fsync_dir(os.path.dirname(os.path.abspath(vault_file)))
+    return size + len(payload)
+
+
+def decode_version(version: dict) -> dict:
+    """Decode a secret version's base64 fields back to bytes, in place.
+
+    load_vault() leaves these fields as the base64 strings read from disk,
+    so only versions that are actually decrypted pay for decoding. Both
+    forms serialize identically. Calling this again is a no-op.
+
+    Args:
+        version: A version dict from vault_data["secrets"][path]["versions"].
+
+    Returns:
+        The same version dict, with bytes fields.
+    """
+    for field in _VER_BIN:
+        value = version.get(field)
+        if isinstance(value, str):
+            version[field] = base64.b64decode(value)
+    return version
+
+
+def _replay_changes(data: dict, wal_file: str) -> None:
+    """Apply the change log's records newer than data["wal_seq"] to data."""
+    try:
+        with open(wal_file, "rb") as f:
+            raw_lines = f.read().split(b"\n")
+    except FileNotFoundError:
+        return
+
+    applied = data.get("wal_seq", 0)
+    secrets = data.setdefault("secrets", {})
+    policies = data.setdefault("policies", [])
+    for raw in raw_lines:
+        if not raw.strip():
+            continue
+        try:
+            record = _loads(raw)
+        except ValueError:
+            # Torn write from a crash; records after it are still valid
+            continue
+        if record["seq"] <= applied:
+            continue
+        op = record["op"]
+        if op == "put":
+            version = record["version"]
+            path = record["path"]
+            if path in secrets:
+                secrets[path]["versions"].append(version)
+            else:
+                secrets[path] = {"path": path, "versions": [version]}
+        elif op == "delete":
+            secrets.pop(record["path"], None)
+        elif op == "add_policy":
+            policies.append(record["policy"])
+        elif op == "remove_policy":
+            # Same swap-with-last removal as Vault.remove_policy
+            for i, pol in enumerate(policies):
+                if pol["identity"] == record["identity"] and pol["path_pattern"] == record["path_pattern"]:
+                    policies[i] = policies[-1]
+                    policies.pop()
+                    break
+        applied = record["seq"]
+    data["wal_seq"] = applied
 
 
 def load_vault(vault_file: str) -> dict:
     """Read vault_file and deserialize JSON into a vault_data dict.
 
-    Base64-encoded fields are decoded back to bytes.
+    Base64-encoded top-level fields are decoded back to bytes, and pending
+    records from the change log (see append_changes) are applied. Secret
+    version fields stay base64 strings until decode_version() is called.
 
     Args:
         vault_file: Path to the vault file.
 
     Returns:
-        The vault data dictionary with bytes fields restored.
+        The vault data dictionary with top-level bytes fields restored.
 
     Raises:
         FileNotFoundError: If vault_file does not exist.
     """
-    with open(vault_file, "r") as f:
-        data = json.load(f)
+    with open(vault_file, "rb") as f:
+        raw = f.read()
+    data = _loads(raw)
 
     # Decode top-level binary fields
-    for field in ("salt", "verification_nonce", "verification_token"):
-        if field in data and isinstance(data[field], str):
-            data[field] = base64.b64decode(data[field])
-
-    # Decode binary fields in secret versions
-    for secret in data.get("secrets", {}).values():
-        for version in secret.get("versions", []):
-            for field in ("encrypted_dek", "dek_nonce", "encrypted_value", "value_nonce"):
-                if field in version and isinstance(version[field], str):
-                    version[field] = base64.b64decode(version[field])
+    for field in _TOP_BIN:
+        value = data.get(field)
+        if isinstance(value, str):
+            data[field] = base64.b64decode(value)
 
+    _replay_changes(data, vault_file + WAL_SUFFIX)
     return data
 
 
+def change_log_exists(vault_file: str) -> bool:
+    """Return True if the vault has changes not yet folded into the vault file."""
+    return os.path.exists(vault_file + WAL_SUFFIX)
+
+
 def save_session(session_file: str, root_key: bytes) -> None:
-    """Write the hex-encoded root key to the session file.
+    """Write the raw root key bytes to the session file.
+
+    The file is created with 0600 permissions so only the owner can read it.
 
     Args:
         session_file: Path to the session file.
         root_key: The root key bytes to persist.
     """
-    with open(session_file, "w") as f:
-        f.write(root_key.hex())
+    fd = os.open(session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        if hasattr(os, "fchmod"):
+            # O_CREAT's mode only applies to new files
+            os.fchmod(fd, 0o600)
+        os.write(fd, root_key)
+    finally:
+        os.close(fd)
 
 
 def load_session(session_file: str) -> bytes | None:
     """Read the root key from the session file.
 
+    Session files written in the older hex format are still accepted.
+
     Args:
         session_file: Path to the session file.
 
     Returns:
-        The root key bytes, or None if the session file does not exist.
+        The root key bytes, or None if the session file does not exist or
+        does not hold a 32-byte key.
     """
-    if not Path(session_file).exists():
+    try:
+        with open(session_file, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
         return None
-    with open(session_file, "r") as f:
-        return bytes.fromhex(f.read().strip())
+    if len(data) == SESSION_KEY_SIZE:
+        return data
+    try:
+        data = bytes.fromhex(data.decode("ascii").strip())
+    except ValueError:
+        return None
+    return data if len(data) == SESSION_KEY_SIZE else None
+
+
+def session_file_exists(session_file: str) -> bool:
+    """Return True if the session file exists, without reading it.
+
+    Args:
+        session_file: Path to the session file.
+
+    Returns:
+        True if file exists, False otherwise.
+    """
+    return os.path.exists(session_file)
 
 
 def delete_session(session_file: str) -> None:
@@ -125,6 +372,7 @@ def delete_session(session_file: str) -> None:
     Args:
         session_file: Path to the session file.
     """
-    path = Path(session_file)
-    if path.exists():
-        path.unlink()
+    try:
+        os.unlink(session_file)
+    except FileNotFoundError:
+        pass
@@ -1,82 +1,169 @@
-# validate.py - Tests all 28 SPEC.md Section 6 scenarios
+# validate.py - Tests all 28 SPEC.md Section 6 scenarios plus 7.x regression checks
 # Automated validation for Secret Management Vault
+import atexit
+import functools
 import os
 import subprocess
 import sys
 import tempfile
+import time
 import shutil
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from io import StringIO
+
+import audit
+import cli
+import vault
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 CLI = os.path.join(ROOT, "cli.py")
-PC = 0
-FC = 0
-RES = []
+
+
+# Keep scratch vaults on tmpfs when available (no disk I/O for fsyncs)
+_TMP_ROOT = ("/dev/shm" if sys.platform.startswith("linux")
+             and os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+             else None)
+
+_ENV = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONUNBUFFERED="1")
 
 
 def rc(args):
+    # No cwd and close_fds=False keep CPython on its posix_spawn fast path;
+    # all paths passed to the CLI are absolute, so cwd is not needed
     r = subprocess.run(
         [sys.executable, CLI] + args,
-        capture_output=True, text=True, cwd=ROOT
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        env=_ENV, close_fds=False
     )
+    # Output stays undecoded; ck/ckn match bytes as well as str
     return r.returncode, r.stdout.strip(), r.stderr.strip()
 
 
-def ck(a, e):
-    if e in a:
-        return True, ""
-    return False, "want %r in %r" % (e, a)
+def _inproc_rc(args):
+    # Same contract as rc(), but runs cli.main() in this process and
+    # returns str output
+    so, se = StringIO(), StringIO()
+    code = 0
+    try:
+        with redirect_stdout(so), redirect_stderr(se):
+            cli.main(args)
+    except SystemExit as x:
+        code = x.code or 0
+    return code, so.getvalue().strip(), se.getvalue().strip()
+
+
+_ISO8601 = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 
 
-def ckn(a, e):
-    if e not in a:
-        return True, ""
-    return False, "unwanted %r in %r" % (e, a)
+# Checks append a diagnostic to d on failure and return whether they passed,
+# so call sites accumulate with: p &= ck(o, "...", d)
+def _as(a, e):
+    # Encode the expected text when matching against raw subprocess bytes
+    return e.encode("utf-8") if isinstance(a, bytes) else e
 
 
-def nzc(c):
+def ck(a, e, d, prefix=""):
+    if _as(a, e) in a:
+        return True
+    d.append(prefix + "want %r in %r" % (e, a))
+    return False
+
+
+def ckn(a, e, d, prefix=""):
+    if _as(a, e) not in a:
+        return True
+    d.append(prefix + "unwanted %r in %r" % (e, a))
+    return False
+
+
+def nzc(c, d, prefix=""):
     if c != 0:
-        return True, ""
-    return False, "exit 0, expected nonzero"
+        return True
+    d.append(prefix + "exit 0, expected nonzero")
+    return False
 
 
-def fex(p):
+def fex(p, d, prefix=""):
     if os.path.exists(p):
-        return True, ""
-    return False, "missing " + p
-
-
-def rep(sid, desc, ok, diag=""):
-    global PC, FC
-    if ok:
-        PC += 1
-    else:
-        FC += 1
-    RES.append((sid, desc, "PASS" if ok else "FAIL", diag))
-    tag = "[PASS]" if ok else "[FAIL]"
-    print("  %s %s: %s" % (tag, sid, desc))
-    if not ok and diag:
-        for ln in diag.strip().split("\n"):
+        return True
+    d.append(prefix + "missing " + p)
+    return False
+
+
+@dataclass(slots=True)
+class Result:
+    sid: str
+    desc: str
+    ok: bool
+    diag: str = ""
+
+
+def rep(r):
+    tag = "[PASS]" if r.ok else "[FAIL]"
+    print("  %s %s: %s" % (tag, r.sid, r.desc))
+    if not r.ok and r.diag:
+        for ln in r.diag.strip().split("\n"):
             print("         " + ln)
 
 
-def _a(p, d, ok, m, prefix=""):
-    if ok:
-        return p, d
-    return False, d + [prefix + m if prefix else m]
+# Temp dirs are never removed one by one. Pool workers create them under
+# the suite's scratch root, which main() removes in a single sweep (worker
+# processes skip atexit); standalone use records them for an atexit sweep.
+_SCRATCH_ROOT = None
+_TMP_DIRS = []
+
+
+def _init_worker(root):
+    global _SCRATCH_ROOT
+    _SCRATCH_ROOT = root
+
+
+def _mkdtemp(prefix):
+    d = tempfile.mkdtemp(prefix=prefix, dir=_SCRATCH_ROOT or _TMP_ROOT)
+    if _SCRATCH_ROOT is None:
+        _TMP_DIRS.append(d)
+    return d
+
+
+@atexit.register
+def _sweep_tmp_dirs():
+    for d in _TMP_DIRS:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_template(pw, caps="read,write,list,delete"):
+    # Sealed vault + audit log with an admin "**" policy, built once per
+    # (password, capabilities) per process; su() copies it instead of
+    # re-running init and add-policy.
+    d = _mkdtemp("vt_tpl_")
+    vf, af = os.path.join(d, "v.enc"), os.path.join(d, "a.log")
+    _inproc_rc(["bootstrap", "--vault-file", vf, "--audit-file", af,
+                "--password", pw, "--identity", "admin", "--path-pattern", "**",
+                "--capabilities", caps])
+    _inproc_rc(["seal", "--vault-file", vf, "--audit-file", af])
+    return vf, af
 
 
 class TV:
-    def __init__(self):
+    # inproc=False runs every command as a separate `python cli.py`
+    # process, for scenarios about state that must not outlive a process
+    def __init__(self, inproc=True):
         self.d = None
+        self.inproc = inproc
 
     def __enter__(self):
-        self.d = tempfile.mkdtemp(prefix="vt_")
+        self.d = _mkdtemp("vt_")
         return self
 
     def __exit__(self, *a):
-        if self.d and os.path.exists(self.d):
-            shutil.rmtree(self.d, ignore_errors=True)
+        pass
+
+    def rc(self, args):
+        return _inproc_rc(args) if self.inproc else rc(args)
 
     @property
     def vf(self):
@@ -87,22 +174,22 @@ class TV:
         return os.path.join(self.d, "a.log")
 
     def init(self, pw="T1"):
-        return rc(["init", "--vault-file", self.vf,
+        return self.rc(["init", "--vault-file", self.vf,
                     "--audit-file", self.af, "--password", pw])
 
     def unseal(self, pw="T1"):
-        return rc(["unseal", "--vault-file", self.vf,
+        return self.rc(["unseal", "--vault-file", self.vf,
                     "--audit-file", self.af, "--password", pw])
 
     def seal(self):
-        return rc(["seal", "--vault-file", self.vf,
+        return self.rc(["seal", "--vault-file", self.vf,
                     "--audit-file", self.af])
 
     def status(self):
-        return rc(["status", "--vault-file", self.vf])
+        return self.rc(["status", "--vault-file", self.vf])
 
     def put(self, p, val, ident):
-        return rc(["put", p, val, "--identity", ident,
+        return self.rc(["put", p, val, "--identity", ident,
                     "--vault-file", self.vf, "--audit-file", self.af])
 
     def get(self, p, ident, ver=None):
@@ -110,10 +197,10 @@ class TV:
                "--vault-file", self.vf, "--audit-file", self.af]
         if ver is not None:
             cmd += ["--version", str(ver)]
-        return rc(cmd)
+        return self.rc(cmd)
 
     def delete(self, p, ident):
-        return rc(["delete", p, "--identity", ident,
+        return self.rc(["delete", p, "--identity", ident,
                     "--vault-file", self.vf, "--audit-file", self.af])
 
     def ls(self, ident, pfx=None):
@@ -122,15 +209,15 @@ class TV:
             cmd.append(pfx)
         cmd += ["--identity", ident,
                 "--vault-file", self.vf, "--audit-file", self.af]
-        return rc(cmd)
+        return self.rc(cmd)
 
     def apol(self, ident, pp, caps):
-        return rc(["add-policy", "--identity", ident,
+        return self.rc(["add-policy", "--identity", ident,
                     "--path-pattern", pp, "--capabilities", caps,
                     "--vault-file", self.vf, "--audit-file", self.af])
 
     def rpol(self, ident, pp):
-        return rc(["remove-policy", "--identity", ident,
+        return self.rc(["remove-policy", "--identity", ident,
                     "--path-pattern", pp,
                     "--vault-file", self.vf, "--audit-file", self.af])
 
@@ -138,27 +225,28 @@ class TV:
         cmd = ["audit-log", "--audit-file", self.af]
         if last:
             cmd += ["--last", str(last)]
-        return rc(cmd)
+        return self.rc(cmd)
 
-    def su(self, pw="T1"):
-        self.init(pw)
-        self.unseal(pw)
-        self.apol("admin", "**", "read,write,list,delete")
+    def su(self, pw="T1", caps="read,write,list,delete"):
+        tvf, taf = _build_template(pw, caps)
+        shutil.copyfile(tvf, self.vf)
+        shutil.copyfile(taf, self.af)
+        return self.unseal(pw)
 
 
 def t61():
     with TV() as v:
         d, p = [], True
         c, o, e = v.init("MMP1")
-        p, d = _a(p, d, *ck(o, "Vault initialized at"))
-        p, d = _a(p, d, *fex(v.vf))
+        p &= ck(o, "Vault initialized at", d)
+        p &= fex(v.vf, d)
         c, o, e = v.status()
-        p, d = _a(p, d, *ck(o, "Status: sealed"))
+        p &= ck(o, "Status: sealed", d)
         c, o, e = v.unseal("MMP1")
-        p, d = _a(p, d, *ck(o, "Vault unsealed successfully."))
+        p &= ck(o, "Vault unsealed successfully.", d)
         c, o, e = v.status()
-        p, d = _a(p, d, *ck(o, "Status: unsealed"))
-        rep("6.1", "Initialize and Unseal a New Vault", p, "\n".join(d))
+        p &= ck(o, "Status: unsealed", d)
+        return Result("6.1", "Initialize and Unseal a New Vault", p, "\n".join(d))
 
 
 def t62():
@@ -166,21 +254,21 @@ def t62():
         d, p = [], True
         v.init("CorrectPW")
         c, o, e = v.unseal("WrongPW")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Incorrect master password"))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Incorrect master password", d)
         c, o, e = v.status()
-        p, d = _a(p, d, *ck(o, "Status: sealed"))
-        rep("6.2", "Reject Unseal with Wrong Password", p, "\n".join(d))
+        p &= ck(o, "Status: sealed", d)
+        return Result("6.2", "Reject Unseal with Wrong Password", p, "\n".join(d))
 
 
 def t63():
     with TV() as v:
         d, p = [], True
-        v.init("MP1"); v.unseal("MP1"); v.apol("admin", "**", "write"); v.seal()
+        v.su("MP1", "write"); v.seal()
         c, o, e = v.put("secrets/key", "myvalue", "admin")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Vault is sealed"))
-        rep("6.3", "Reject Operations When Sealed", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Vault is sealed", d)
+        return Result("6.3", "Reject Operations When Sealed", p, "\n".join(d))
 
 
 def t64():
@@ -188,11 +276,11 @@ def t64():
         d, p = [], True
         v.su("MP1")
         c, o, e = v.put("production/db/password", "s3cretValue!", "admin")
-        p, d = _a(p, d, *ck(o, "Secret stored at production/db/password (version 1)"))
+        p &= ck(o, "Secret stored at production/db/password (version 1)", d)
         c, o, e = v.get("production/db/password", "admin")
         for s in ["Path: production/db/password", "Version: 1", "Value: s3cretValue!"]:
-            p, d = _a(p, d, *ck(o, s))
-        rep("6.4", "Store and Retrieve with Envelope Encryption", p, "\n".join(d))
+            p &= ck(o, s, d)
+        return Result("6.4", "Store and Retrieve with Envelope Encryption", p, "\n".join(d))
 
 
 def t65():
@@ -202,20 +290,20 @@ def t65():
         v.put("path/secret-a", "value-a", "admin")
         v.put("path/secret-b", "value-b", "admin")
         c, o, e = v.get("path/secret-a", "admin")
-        p, d = _a(p, d, *ck(o, "Value: value-a"))
+        p &= ck(o, "Value: value-a", d)
         c, o, e = v.get("path/secret-b", "admin")
-        p, d = _a(p, d, *ck(o, "Value: value-b"))
-        rep("6.5", "Verify Different DEKs for Different Secrets", p, "\n".join(d))
+        p &= ck(o, "Value: value-b", d)
+        return Result("6.5", "Verify Different DEKs for Different Secrets", p, "\n".join(d))
 
 
 def t66():
     with TV() as v:
         d, p = [], True
-        v.init(); v.unseal(); v.apol("admin", "**", "read")
+        v.su(caps="read")
         c, o, e = v.get("nonexistent/path", "admin")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Secret not found at path 'nonexistent/path'"))
-        rep("6.6", "Retrieve Secret Not Found", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Secret not found at path 'nonexistent/path'", d)
+        return Result("6.6", "Retrieve Secret Not Found", p, "\n".join(d))
 
 
 def t67():
@@ -223,11 +311,11 @@ def t67():
         d, p = [], True
         v.su(); v.put("temp/api-key", "abc123", "admin")
         c, o, e = v.delete("temp/api-key", "admin")
-        p, d = _a(p, d, *ck(o, "Secret deleted at temp/api-key"))
+        p &= ck(o, "Secret deleted at temp/api-key", d)
         c, o, e = v.get("temp/api-key", "admin")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Secret not found at path 'temp/api-key'"))
-        rep("6.7", "Delete a Secret", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Secret not found at path 'temp/api-key'", d)
+        return Result("6.7", "Delete a Secret", p, "\n".join(d))
 
 
 def t68():
@@ -238,20 +326,20 @@ def t68():
                           ("prod/api/key", "k1"), ("staging/db/user", "u2")]:
             v.put(path, val, "admin")
         c, o, e = v.ls("admin", "prod/db")
-        p, d = _a(p, d, *ck(o, "prod/db/user"))
-        p, d = _a(p, d, *ck(o, "prod/db/pass"))
-        p, d = _a(p, d, *ckn(o, "prod/api/key"))
-        p, d = _a(p, d, *ckn(o, "staging/db/user"))
-        rep("6.8", "List Secrets by Prefix", p, "\n".join(d))
+        p &= ck(o, "prod/db/user", d)
+        p &= ck(o, "prod/db/pass", d)
+        p &= ckn(o, "prod/api/key", d)
+        p &= ckn(o, "staging/db/user", d)
+        return Result("6.8", "List Secrets by Prefix", p, "\n".join(d))
 
 
 def t69():
     with TV() as v:
         d, p = [], True
-        v.init(); v.unseal(); v.apol("admin", "**", "list")
+        v.su(caps="list")
         c, o, e = v.ls("admin")
-        p, d = _a(p, d, *ck(o, "No secrets found."))
-        rep("6.9", "List Returns Empty When No Secrets Match", p, "\n".join(d))
+        p &= ck(o, "No secrets found.", d)
+        return Result("6.9", "List Returns Empty When No Secrets Match", p, "\n".join(d))
 
 
 def t610():
@@ -259,9 +347,9 @@ def t610():
         d, p = [], True
         v.su()
         c, o, e = v.put("invalid//path", "value", "admin")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Invalid path format"))
-        rep("6.10", "Invalid Path Format Rejected", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Invalid path format", d)
+        return Result("6.10", "Invalid Path Format Rejected", p, "\n".join(d))
 
 
 def t611():
@@ -272,9 +360,9 @@ def t611():
         v.apol("service-b", "app-b/**", "read")
         v.put("app-a/db/password", "secret123", "service-a")
         c, o, e = v.get("app-a/db/password", "service-b")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Access denied for identity 'service-b' on path 'app-a/db/password' (requires read)"))
-        rep("6.11", "Access Control Denies Unauthorized Read", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Access denied for identity 'service-b' on path 'app-a/db/password' (requires read)", d)
+        return Result("6.11", "Access Control Denies Unauthorized Read", p, "\n".join(d))
 
 
 def t612():
@@ -286,8 +374,8 @@ def t612():
         v.put("app-a/db/password", "secret123", "service-a")
         c, o, e = v.get("app-a/db/password", "service-a")
         for s in ["Path: app-a/db/password", "Version: 1", "Value: secret123"]:
-            p, d = _a(p, d, *ck(o, s))
-        rep("6.12", "Access Control Grants Authorized Read", p, "\n".join(d))
+            p &= ck(o, s, d)
+        return Result("6.12", "Access Control Grants Authorized Read", p, "\n".join(d))
 
 
 def t613():
@@ -296,13 +384,13 @@ def t613():
         v.init(); v.unseal()
         v.apol("deployer", "production/*/credentials", "read,write")
         c, o, e = v.put("production/web/credentials", "web-cred", "deployer")
-        p, d = _a(p, d, *ck(o, "Secret stored at production/web/credentials (version 1)"))
+        p &= ck(o, "Secret stored at production/web/credentials (version 1)", d)
         c, o, e = v.put("production/cache/credentials", "cache-cred", "deployer")
-        p, d = _a(p, d, *ck(o, "Secret stored at production/cache/credentials (version 1)"))
+        p &= ck(o, "Secret stored at production/cache/credentials (version 1)", d)
         c, o, e = v.put("production/web/config", "web-config", "deployer")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Access denied"))
-        rep("6.13", "Glob Wildcard Policy Matching", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Access denied", d)
+        return Result("6.13", "Glob Wildcard Policy Matching", p, "\n".join(d))
 
 
 def t614():
@@ -310,10 +398,10 @@ def t614():
         d, p = [], True
         v.su()
         c, o, e = v.put("any/deep/nested/path", "value", "admin")
-        p, d = _a(p, d, *ck(o, "Secret stored at any/deep/nested/path (version 1)"))
+        p &= ck(o, "Secret stored at any/deep/nested/path (version 1)", d)
         c, o, e = v.get("any/deep/nested/path", "admin")
-        p, d = _a(p, d, *ck(o, "Value: value"))
-        rep("6.14", "Double-Star Wildcard Policy Matching", p, "\n".join(d))
+        p &= ck(o, "Value: value", d)
+        return Result("6.14", "Double-Star Wildcard Policy Matching", p, "\n".join(d))
 
 
 def t615():
@@ -321,9 +409,9 @@ def t615():
         d, p = [], True
         v.init(); v.unseal()
         c, o, e = v.put("secrets/key", "value", "unknown-user")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Access denied"))
-        rep("6.15", "Default Deny When No Policy Exists", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Access denied", d)
+        return Result("6.15", "Default Deny When No Policy Exists", p, "\n".join(d))
 
 
 def t616():
@@ -331,10 +419,10 @@ def t616():
         d, p = [], True
         v.init(); v.unseal()
         c, o, e = v.apol("reader", "reports/*", "read,list")
-        p, d = _a(p, d, *ck(o, "Policy added: identity='reader', path='reports/*', capabilities=[read, list]"))
+        p &= ck(o, "Policy added: identity='reader', path='reports/*', capabilities=[read, list]", d)
         c, o, e = v.rpol("reader", "reports/*")
-        p, d = _a(p, d, *ck(o, "Policy removed: identity='reader', path='reports/*'"))
-        rep("6.16", "Add and Remove a Policy", p, "\n".join(d))
+        p &= ck(o, "Policy removed: identity='reader', path='reports/*'", d)
+        return Result("6.16", "Add and Remove a Policy", p, "\n".join(d))
 
 
 def t617():
@@ -343,11 +431,14 @@ def t617():
         v.init("TP1"); v.unseal("TP1")
         v.apol("service-x", "data/**", "read,write")
         c, o, e = v.put("data/item", "val1", "service-x")
-        p, d = _a(p, d, *ck(o, "Secret stored at data/item (version 1)"))
+        p &= ck(o, "Secret stored at data/item (version 1)", d)
         v.seal(); v.unseal("TP1")
         c, o, e = v.get("data/item", "service-x")
-        p, d = _a(p, d, *ck(o, "Value: val1"))
-        rep("6.17", "Policies Persist Across Seal/Unseal", p, "\n".join(d))
+        p &= ck(o, "Value: val1", d)
+        return Result("6.17", "Policies Persist Across Seal/Unseal", p, "\n".join(d))
+
+
+_T618_KEYWORDS = ("init", "unseal", "store", "audit/test", "retrieve", "denied")
 
 
 def t618():
@@ -359,15 +450,14 @@ def t618():
         v.get("audit/test", "admin")
         v.get("audit/test", "unauthorized")
         c, o, e = v.alog()
-        for kw in ["init", "unseal", "store", "audit/test", "retrieve", "denied"]:
-            ok, m = ck(o, kw)
-            if not ok:
-                p = False
-                d.append("Missing '%s': %s" % (kw, m))
-        if not re.search(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", o):
+        missing = [kw for kw in _T618_KEYWORDS if kw not in o]
+        if missing:
+            p = False
+            d.append("Missing: " + ", ".join(missing))
+        if not _ISO8601.search(o):
             p = False
             d.append("No ISO 8601 timestamp")
-        rep("6.18", "Audit Log Records All Operations", p, "\n".join(d))
+        return Result("6.18", "Audit Log Records All Operations", p, "\n".join(d))
 
 
 def t619():
@@ -375,14 +465,11 @@ def t619():
         d, p = [], True
         v.init(); v.unseal(); v.apol("admin", "**", "write")
         c, o, e = v.put("timing/secret", "value", "admin")
-        p, d = _a(p, d, *ck(o, "Secret stored at timing/secret (version 1)"))
+        p &= ck(o, "Secret stored at timing/secret (version 1)", d)
         c2, o2, e2 = v.alog()
         for kw in ["store", "timing/secret", "success"]:
-            ok, m = ck(o2, kw)
-            if not ok:
-                p = False
-                d.append("Audit missing '%s'" % kw)
-        rep("6.19", "Audit Log Entry Written Before Result", p, "\n".join(d))
+            p &= ck(o2, kw, d, "Audit missing '%s': " % kw)
+        return Result("6.19", "Audit Log Entry Written Before Result", p, "\n".join(d))
 
 
 def t620():
@@ -390,21 +477,21 @@ def t620():
         d, p = [], True
         v.su()
         c, o, e = v.put("config/api-key", "key-v1", "admin")
-        p, d = _a(p, d, *ck(o, "Secret stored at config/api-key (version 1)"))
+        p &= ck(o, "Secret stored at config/api-key (version 1)", d)
         c, o, e = v.put("config/api-key", "key-v2", "admin")
-        p, d = _a(p, d, *ck(o, "Secret updated at config/api-key (version 2)"))
+        p &= ck(o, "Secret updated at config/api-key (version 2)", d)
         c, o, e = v.put("config/api-key", "key-v3", "admin")
-        p, d = _a(p, d, *ck(o, "Secret updated at config/api-key (version 3)"))
+        p &= ck(o, "Secret updated at config/api-key (version 3)", d)
         c, o, e = v.get("config/api-key", "admin")
-        p, d = _a(p, d, *ck(o, "Version: 3"))
-        p, d = _a(p, d, *ck(o, "Value: key-v3"))
+        p &= ck(o, "Version: 3", d)
+        p &= ck(o, "Value: key-v3", d)
         c, o, e = v.get("config/api-key", "admin", ver=1)
-        p, d = _a(p, d, *ck(o, "Version: 1"))
-        p, d = _a(p, d, *ck(o, "Value: key-v1"))
+        p &= ck(o, "Version: 1", d)
+        p &= ck(o, "Value: key-v1", d)
         c, o, e = v.get("config/api-key", "admin", ver=2)
-        p, d = _a(p, d, *ck(o, "Version: 2"))
-        p, d = _a(p, d, *ck(o, "Value: key-v2"))
-        rep("6.20", "Secret Versioning on Update", p, "\n".join(d))
+        p &= ck(o, "Version: 2", d)
+        p &= ck(o, "Value: key-v2", d)
+        return Result("6.20", "Secret Versioning on Update", p, "\n".join(d))
 
 
 def t621():
@@ -414,35 +501,33 @@ def t621():
         v.put("config/api-key", "v1", "admin")
         v.put("config/api-key", "v2", "admin")
         c, o, e = v.get("config/api-key", "admin", ver=99)
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Version 99 not found for path 'config/api-key'"))
-        rep("6.21", "Version Not Found Error", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Version 99 not found for path 'config/api-key'", d)
+        return Result("6.21", "Version Not Found Error", p, "\n".join(d))
 
 
 def t622():
-    with TV() as v:
+    with TV(inproc=False) as v:
         d, p = [], True
-        v.init("ST1"); v.unseal("ST1")
-        v.apol("admin", "**", "read,write")
+        v.su("ST1", "read,write")
         v.put("test/key", "before-seal", "admin")
         c, o, e = v.seal()
-        p, d = _a(p, d, *ck(o, "Vault sealed."))
+        p &= ck(o, "Vault sealed.", d)
         c, o, e = v.get("test/key", "admin")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Vault is sealed"))
-        rep("6.22", "Seal Discards Root Key", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Vault is sealed", d)
+        return Result("6.22", "Seal Discards Root Key", p, "\n".join(d))
 
 
 def t623():
     with TV() as v:
         d, p = [], True
-        v.init("PT1"); v.unseal("PT1")
-        v.apol("admin", "**", "read,write")
+        v.su("PT1", "read,write")
         v.put("persist/secret", "persistent-value", "admin")
         v.seal(); v.unseal("PT1")
         c, o, e = v.get("persist/secret", "admin")
-        p, d = _a(p, d, *ck(o, "Value: persistent-value"))
-        rep("6.23", "Secrets Persist Across Seal/Unseal Cycles", p, "\n".join(d))
+        p &= ck(o, "Value: persistent-value", d)
+        return Result("6.23", "Secrets Persist Across Seal/Unseal Cycles", p, "\n".join(d))
 
 
 def t624():
@@ -450,40 +535,39 @@ def t624():
         d, p = [], True
         v.init(); v.unseal()
         c, o, e = v.apol("test", "path/*", "read,execute")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Invalid capability 'execute'"))
-        rep("6.24", "CLI Error Output and Exit Codes", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Invalid capability 'execute'", d)
+        return Result("6.24", "CLI Error Output and Exit Codes", p, "\n".join(d))
 
 
 def t625():
     with TV() as v:
         d, p = [], True
-        v.init(); v.unseal(); v.apol("admin", "**", "delete")
+        v.su(caps="delete")
         c, o, e = v.delete("ghost/secret", "admin")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Secret not found at path 'ghost/secret'"))
-        rep("6.25", "Delete Nonexistent Secret Returns Error", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Secret not found at path 'ghost/secret'", d)
+        return Result("6.25", "Delete Nonexistent Secret Returns Error", p, "\n".join(d))
 
 
 def t626():
     with TV() as v:
         d, p = [], True
-        v.init(); v.unseal()
-        v.apol("admin", "**", "read,write,list,delete")
+        v.su()
         v.put("data/item", "readable", "admin")
         v.apol("limited", "data/**", "read")
         c, o, e = v.get("data/item", "limited")
-        p, d = _a(p, d, *ck(o, "Value: readable"), "Read: ")
+        p &= ck(o, "Value: readable", d, "Read: ")
         c, o, e = v.put("data/item", "new-val", "limited")
-        p, d = _a(p, d, *nzc(c), "Write: ")
-        p, d = _a(p, d, *ck(e, "Error: Access denied"), "Write err: ")
+        p &= nzc(c, d, "Write: ")
+        p &= ck(e, "Error: Access denied", d, "Write err: ")
         c, o, e = v.ls("limited", "data")
-        p, d = _a(p, d, *nzc(c), "List: ")
-        p, d = _a(p, d, *ck(e, "Error: Access denied"), "List err: ")
+        p &= nzc(c, d, "List: ")
+        p &= ck(e, "Error: Access denied", d, "List err: ")
         c, o, e = v.delete("data/item", "limited")
-        p, d = _a(p, d, *nzc(c), "Del: ")
-        p, d = _a(p, d, *ck(e, "Error: Access denied"), "Del err: ")
-        rep("6.26", "Capability Mapping Enforced", p, "\n".join(d))
+        p &= nzc(c, d, "Del: ")
+        p &= ck(e, "Error: Access denied", d, "Del err: ")
+        return Result("6.26", "Capability Mapping Enforced", p, "\n".join(d))
 
 
 def t627():
@@ -491,9 +575,9 @@ def t627():
         d, p = [], True
         v.init("NP1")
         c, o, e = v.init("NP1")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: Vault file already exists"))
-        rep("6.27", "Vault Init Rejects Existing File", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: Vault file already exists", d)
+        return Result("6.27", "Vault Init Rejects Existing File", p, "\n".join(d))
 
 
 def t628():
@@ -501,32 +585,361 @@ def t628():
         d, p = [], True
         v.init(); v.unseal()
         c, o, e = v.rpol("phantom", "any/*")
-        p, d = _a(p, d, *nzc(c))
-        p, d = _a(p, d, *ck(e, "Error: No policy found"))
-        rep("6.28", "Remove Nonexistent Policy Returns Error", p, "\n".join(d))
+        p &= nzc(c, d)
+        p &= ck(e, "Error: No policy found", d)
+        return Result("6.28", "Remove Nonexistent Policy Returns Error", p, "\n".join(d))
+
+
+# -- 7.x: regression checks beyond SPEC.md Section 6 --
+
+
+def t71():
+    # Audit chain: unchained lines are accepted only before the first
+    # chained entry; stripping the chain field from later entries is tampering
+    with TV() as v:
+        d, p = [], True
+        with open(v.af, "w", encoding="utf-8") as f:
+            f.write("2020-01-01T00:00:00+00:00 | system | init | - | success\n")
+        v.init(); v.unseal()
+        v.apol("admin", "**", "read,write")
+        v.put("a/b", "x", "admin")
+        v.get("a/b", "admin")
+        c, o, e = v.rc(["verify-audit", "--audit-file", v.af])
+        p &= ck(o, "Audit log chain intact (6 entries)", d, "intact: ")
+
+        with open(v.af, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        forged = [ln.split(" | ", 1)[1].replace("admin", "mallory") for ln in lines[3:]]
+        with open(v.af, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines[:3] + forged) + "\n")
+        c, o, e = v.rc(["verify-audit", "--audit-file", v.af])
+        p &= nzc(c, d, "stripped: ")
+        p &= ck(e, "Error: Audit log chain broken at entry 4", d, "stripped: ")
+        return Result("7.1", "Audit Chain Rejects Stripped Chain Fields", p, "\n".join(d))
+
+
+def t72():
+    # Change log: every command below is a new process, so secrets and
+    # policies must come back from replaying <vault>.wal
+    with TV(inproc=False) as v:
+        d, p = [], True
+        v.su("WR1", "read,write,delete")
+        v.put("app/db", "one", "admin")
+        v.put("app/db", "two", "admin")
+        v.put("app/tmp", "gone", "admin")
+        v.delete("app/tmp", "admin")
+        v.apol("bob", "app/*", "read")
+        v.apol("eve", "app/*", "read")
+        v.rpol("eve", "app/*")
+        p &= fex(v.vf + ".wal", d)
+        c, o, e = v.get("app/db", "bob")
+        p &= ck(o, "Value: two", d, "bob: ")
+        p &= ck(o, "Version: 2", d, "bob: ")
+        c, o, e = v.get("app/tmp", "admin")
+        p &= ck(e, "Error: Secret not found at path 'app/tmp'", d, "deleted: ")
+        c, o, e = v.get("app/db", "eve")
+        p &= nzc(c, d, "removed policy: ")
+        return Result("7.2", "Change Log Replays in a Fresh Process", p, "\n".join(d))
+
+
+def t73():
+    # A change log left behind after compaction (crash between replacing
+    # the vault file and unlinking the log) must not be applied twice
+    with TV() as v:
+        d, p = [], True
+        v.su("WC1", "read,write")
+        v.put("k", "v1", "admin")
+        v.put("k", "v2", "admin")
+        wal = v.vf + ".wal"
+        shutil.copyfile(wal, wal + ".bak")
+        v.seal()
+        if os.path.exists(wal):
+            p = False
+            d.append("change log still present after seal")
+        os.replace(wal + ".bak", wal)
+        v.unseal("WC1")
+        c, o, e = v.get("k", "admin")
+        p &= ck(o, "Value: v2", d, "leftover: ")
+        p &= ck(o, "Version: 2", d, "leftover: ")
+        c, o, e = v.put("k", "v3", "admin")
+        p &= ck(o, "Secret updated at k (version 3)", d, "after: ")
+        v.seal(); v.unseal("WC1")
+        c, o, e = v.get("k", "admin")
+        p &= ck(o, "Version: 3", d, "reseal: ")
+        return Result("7.3", "Leftover Change Log Is Not Replayed Twice", p, "\n".join(d))
+
+
+def t74():
+    # A torn trailing record (crash mid-append) is skipped, and records
+    # appended after it are still replayed
+    with TV() as v:
+        d, p = [], True
+        v.su("WT1", "read,write")
+        v.put("k", "v1", "admin")
+        with open(v.vf + ".wal", "a", encoding="utf-8") as f:
+            f.write('{"seq": 99, "op": "put", "pa')
+        c, o, e = v.get("k", "admin")
+        p &= ck(o, "Value: v1", d, "torn: ")
+        c, o, e = v.put("k2", "v2", "admin")
+        p &= ck(o, "Secret stored at k2 (version 1)", d, "append: ")
+        c, o, e = v.get("k2", "admin")
+        p &= ck(o, "Value: v2", d, "append: ")
+        v.seal(); v.unseal("WT1")
+        c, o, e = v.get("k2", "admin")
+        p &= ck(o, "Value: v2", d, "reseal: ")
+        return Result("7.4", "Torn Change Log Record Is Skipped", p, "\n".join(d))
+
+
+def _audit_lines(af):
+    if not os.path.exists(af):
+        return []
+    with open(af, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def _wait_for(cond, timeout=3.0):
+    # Poll rather than sleep a fixed time; timers run late on a busy box
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def t75():
+    # Buffering and summary mode together: buffered entries follow
+    # flush_interval, summaries follow summary_interval
+    with TV() as v:
+        d, p = [], True
+        lg = audit.AuditLogger(v.af, buffer_size=10, flush_interval=0.05, summary_interval=1.0)
+        start = time.monotonic()
+        lg.count_event("admin", "get", "a/b")
+        lg.log_event("admin", "put", "a/b", "success")
+        if not _wait_for(lambda: len(_audit_lines(v.af)) == 1, 0.5):
+            p = False
+            d.append("buffered entry not written within flush_interval: %r" % _audit_lines(v.af))
+        lg.count_event("admin", "get", "a/b")
+        lg.count_event("admin", "get", "a/b")
+        if time.monotonic() - start < 0.9:
+            p &= ckn("\n".join(_audit_lines(v.af)), "count=", d, "early summary: ")
+        _wait_for(lambda: len(_audit_lines(v.af)) == 2)
+        p &= ck("\n".join(_audit_lines(v.af)), "count=3 since=", d, "summary: ")
+        lg.close()
+        c, o, e = v.rc(["verify-audit", "--audit-file", v.af])
+        p &= ck(o, "Audit log chain intact (2 entries)", d)
+        return Result("7.5", "Buffer Flush and Summary Intervals Are Independent", p, "\n".join(d))
+
+
+def t76():
+    # put-batch: all-or-nothing multi-secret writes from a JSON Lines file
+    with TV() as v:
+        d, p = [], True
+        v.su("PB1", "read,write,list")
+        v.apol("ro", "**", "read")
+
+        def batch(name, *lines):
+            bf = os.path.join(v.d, name)
+            with open(bf, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            return bf
+
+        def put_batch(bf, ident="admin"):
+            return v.rc(["put-batch", "--file", bf, "--identity", ident,
+                         "--vault-file", v.vf, "--audit-file", v.af])
+
+        c, o, e = put_batch(batch("ok.jsonl",
+                                  '{"path": "b/one", "value": "1"}',
+                                  '{"path": "b/two", "value": "2"}',
+                                  '{"path": "b/one", "value": "1b"}'))
+        p &= ck(o, "Secret stored at b/one (version 1)", d, "batch: ")
+        p &= ck(o, "Secret updated at b/one (version 2)", d, "batch: ")
+        c, o, e = v.get("b/one", "admin")
+        p &= ck(o, "Value: 1b", d, "get: ")
+        p &= ck(o, "Version: 2", d, "get: ")
+        c, o, e = v.ls("admin", "b/")
+        p &= ck(o, "b/one\nb/two", d, "list: ")
+
+        c, o, e = put_batch(batch("badpath.jsonl",
+                                  '{"path": "b/three", "value": "3"}',
+                                  '{"path": "bad path!", "value": "x"}'))
+        p &= nzc(c, d, "bad path: ")
+        p &= ck(e, "Error: Invalid path format: 'bad path!'", d, "bad path: ")
+        c, o, e = v.get("b/three", "admin")
+        p &= ck(e, "Secret not found at path 'b/three'", d, "bad path: ")
+
+        c, o, e = put_batch(batch("ro.jsonl", '{"path": "b/two", "value": "ro"}'), "ro")
+        p &= nzc(c, d, "denied: ")
+        p &= ck(e, "Access denied for identity 'ro' on path 'b/two' (requires write)", d, "denied: ")
+        c, o, e = v.get("b/two", "admin")
+        p &= ck(o, "Version: 1", d, "denied: ")
+
+        c, o, e = put_batch(batch("torn.jsonl", '{"path": "b/four", "value": "4"}', '{"path": '))
+        if c != 1:
+            p = False
+            d.append("malformed: exit %r, expected 1" % c)
+        p &= ck(e, "Error: Cannot read batch file", d, "malformed: ")
+        c, o, e = v.get("b/four", "admin")
+        p &= ck(e, "Secret not found at path 'b/four'", d, "malformed: ")
+        return Result("7.6", "Put-Batch Is All-or-Nothing", p, "\n".join(d))
+
+
+def t77():
+    # Vault.get_secrets (library API): results in input order; a denied or
+    # missing path fails the whole batch and is recorded in the audit log
+    with TV() as v:
+        d, p = [], True
+        v.su("GS1", "read,write")
+        v.apol("bob", "app/**", "read")
+        for path, val in (("app/a", "va"), ("app/b", "vb"), ("app/c", "vc"), ("ops/x", "vx")):
+            v.put(path, val, "admin")
+        vt = vault.Vault(v.vf, v.af)
+        try:
+            got = vt.get_secrets(["app/c", "app/a", "app/b"], "bob")
+            want = [("app/c", "vc"), ("app/a", "va"), ("app/b", "vb")]
+            if [(r["path"], r["value"]) for r in got] != want:
+                p = False
+                d.append("order/values: %r" % got)
+
+            for paths, err, entry in (
+                (["app/a", "ops/x"], "Access denied for identity 'bob' on path 'ops/x'",
+                 "| bob | retrieve | ops/x | denied"),
+                (["app/a", "app/zz"], "Secret not found at path 'app/zz'",
+                 "| bob | retrieve | app/zz | error"),
+            ):
+                before = len(_audit_lines(v.af))
+                try:
+                    vt.get_secrets(paths, "bob")
+                    p = False
+                    d.append("%r: no error raised" % paths)
+                except vault.VaultError as x:
+                    p &= ck(str(x), err, d)
+                added = "\n".join(_audit_lines(v.af)[before:])
+                p &= ck(added, entry, d, "audit: ")
+                p &= ckn(added, "| bob | retrieve | app/a | success", d, "audit: ")
+        finally:
+            vt.close()
+        c, o, e = v.rc(["verify-audit", "--audit-file", v.af])
+        p &= ck(o, "Audit log chain intact", d)
+        return Result("7.7", "Batch Read Keeps Order and Audits Failures", p, "\n".join(d))
+
+
+def t78():
+    # Buffered audit logging: entries reach the file when buffer_size is
+    # reached, when flush_interval expires, and on close(); the chain holds
+    with TV() as v:
+        d, p = [], True
+
+        def intact(n, prefix):
+            c, o, e = v.rc(["verify-audit", "--audit-file", v.af])
+            return ck(o, "Audit log chain intact (%d entries)" % n, d, prefix)
+
+        lg = audit.AuditLogger(v.af, buffer_size=3, flush_interval=60.0)
+        lg.log_events([("admin", "put", "a/%d" % i, "success") for i in range(2)])
+        if _audit_lines(v.af):
+            p = False
+            d.append("size: written before buffer_size was reached")
+        lg.log_event("admin", "put", "a/2", "success")
+        if len(_audit_lines(v.af)) != 3:
+            p = False
+            d.append("size: %d entries written, expected 3" % len(_audit_lines(v.af)))
+        p &= intact(3, "size: ")
+        lg.close()
+
+        lg = audit.AuditLogger(v.af, buffer_size=100, flush_interval=0.05)
+        lg.log_event("admin", "put", "a/3", "success")
+        if not _wait_for(lambda: len(_audit_lines(v.af)) == 4):
+            p = False
+            d.append("interval: entry not written after flush_interval")
+        p &= intact(4, "interval: ")
+        lg.close()
+
+        lg = audit.AuditLogger(v.af, buffer_size=100, flush_interval=60.0)
+        lg.log_events([("admin", "put", "a/%d" % i, "success") for i in range(4, 6)])
+        lg.close()
+        if len(_audit_lines(v.af)) != 6:
+            p = False
+            d.append("close: %d entries written, expected 6" % len(_audit_lines(v.af)))
+        p &= intact(6, "close: ")
+        return Result("7.8", "Buffered Audit Entries Are Written on Every Trigger", p, "\n".join(d))
+
+
+def t79():
+    # init KDF options: a sha512 vault unseals only with its password, and
+    # an iteration count below the minimum is refused
+    with TV() as v:
+        d, p = [], True
+        c, o, e = v.rc(["init", "--vault-file", v.vf, "--audit-file", v.af,
+                        "--password", "K5", "--kdf-hash", "sha512"])
+        p &= ck(o, "Vault initialized", d, "init: ")
+        with open(v.vf, "rb") as f:
+            p &= ck(f.read(), "sha512", d, "stored hash: ")
+        c, o, e = v.unseal("wrong")
+        p &= nzc(c, d, "wrong password: ")
+        p &= ck(e, "Error: Incorrect master password", d, "wrong password: ")
+        c, o, e = v.unseal("K5")
+        p &= ck(o, "Vault unsealed successfully.", d, "unseal: ")
+
+        low = os.path.join(v.d, "low.enc")
+        c, o, e = v.rc(["init", "--vault-file", low, "--audit-file", v.af,
+                        "--password", "K5", "--iterations", "5"])
+        p &= nzc(c, d, "iterations: ")
+        p &= ck(e, "Error: Iterations must be at least 600000", d, "iterations: ")
+        if os.path.exists(low):
+            p = False
+            d.append("iterations: vault file created anyway")
+        return Result("7.9", "KDF Hash and Iteration Options", p, "\n".join(d))
+
+
+_SCENARIO_NAME = re.compile(r"t([67])(\d+)$")
+
+
+def _discover():
+    # Every t6<N>/t7<N> function is a scenario; order numerically (6.2 before 6.10)
+    found = []
+    for name, fn in globals().items():
+        m = _SCENARIO_NAME.match(name)
+        if m and callable(fn):
+            found.append(((int(m.group(1)), int(m.group(2))), fn))
+    return [fn for _, fn in sorted(found, key=lambda x: x[0])]
+
+
+def _run_one(f):
+    try:
+        return f()
+    except Exception as x:
+        sid = f.__name__[1:]
+        sid = sid[0] + "." + sid[1:]
+        return Result(sid, "EXCEPTION: %s" % x, False, str(x))
 
 
 def main():
     print("=" * 70)
     print("Secret Management Vault -- Validation Suite")
-    print("SPEC.md Section 6: All 28 Behavior Scenarios")
+    print("SPEC.md Section 6: All 28 Behavior Scenarios, plus 7.x regression checks")
     print("=" * 70)
     print()
-    ts = [t61, t62, t63, t64, t65, t66, t67, t68, t69, t610,
-          t611, t612, t613, t614, t615, t616, t617, t618, t619,
-          t620, t621, t622, t623, t624, t625, t626, t627, t628]
-    for f in ts:
-        try:
-            f()
-        except Exception as x:
-            sid = f.__name__[1:]
-            sid = sid[0] + "." + sid[1:]
-            rep(sid, "EXCEPTION: %s" % x, False, str(x))
+    ts = _discover()
+    # Each scenario uses its own temp dir, so they can run concurrently
+    workers = max(2, (os.cpu_count() or 1) - 2)
+    scratch = tempfile.mkdtemp(prefix="vt_run_", dir=_TMP_ROOT)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(scratch,)) as ex:
+            results = []
+            for res in ex.map(_run_one, ts):
+                rep(res)
+                results.append(res)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    # Tally once in the parent; workers share no counters
+    pc = sum(r.ok for r in results)
+    fc = len(results) - pc
     print()
     print("=" * 70)
-    print("Results: %d/%d passed, %d failed" % (PC, PC + FC, FC))
+    print("Results: %d/%d passed, %d failed" % (pc, pc + fc, fc))
     print("=" * 70)
-    sys.exit(1 if FC > 0 else 0)
+    sys.exit(1 if fc > 0 else 0)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,9 @@
 #           REQ-CRUD-001 through REQ-CRUD-008, REQ-ACL-001 through REQ-ACL-009,
 #           REQ-AUD-001 through REQ-AUD-005, REQ-VER-001 through REQ-VER-006
 
-import datetime
+import bisect
+import contextlib
+import os
 
 import audit
 import crypto
@@ -13,6 +15,14 @@ import policy
 import storage
 
 
+# "summary" aggregates successful reads in the audit log; see Vault
+AUDIT_MODES = ("verbose", "summary")
+
+# An open handle on the session file would stop it from being deleted on
+# Windows, so elsewhere the cached root key is checked by path instead
+_HOLD_SESSION_HANDLE = os.name == "posix"
+
+
 class VaultError(Exception):
     """Base exception for vault operation errors."""
     pass
@@ -22,24 +32,107 @@ class Vault:
     """Central API for the Secret Management Vault.
 
     Coordinates initialization, seal/unseal lifecycle, CRUD on secrets,
-    policy management, and audit logging. The root key is loaded from
-    the session file on each operation and not stored as an instance attribute.
+    policy management, and audit logging. The root key comes from the
+    session file; the copy read last is kept only while that file is
+    unchanged, so sealing from any process takes effect immediately.
 
     Args:
         vault_file: Path to the encrypted vault JSON file.
         audit_file: Path to the audit log file.
+        fsync_policy: Durability policy for vault file writes; see
+            storage.FSYNC_POLICIES.
+        audit_buffer_size: Number of audit entries to buffer before writing
+            (1 writes each entry immediately); see audit.AuditLogger.
+        audit_mode: "verbose" (default) logs every operation; "summary"
+            logs successful reads and lists as periodic per-path counts
+            while denials, errors, and writes are still logged one by one.
+
+    Raises:
+        ValueError: If audit_mode is not recognized.
     """
 
-    def __init__(self, vault_file: str = "vault.enc", audit_file: str = "audit.log") -> None:
+    def __init__(
+        self,
+        vault_file: str = "vault.enc",
+        audit_file: str = "audit.log",
+        fsync_policy: str = "always",
+        audit_buffer_size: int = 1,
+        audit_mode: str = "verbose",
+    ) -> None:
+        if audit_mode not in AUDIT_MODES:
+            raise ValueError(f"Unknown audit mode '{audit_mode}'")
         self.vault_file = vault_file
         self.audit_file = audit_file
+        self.fsync_policy = fsync_policy
+        # Derived paths, built once rather than on every operation
+        self._session_file = vault_file + storage.SESSION_SUFFIX
+        self._wal_file = vault_file + storage.WAL_SUFFIX
+        self._audit = audit.AuditLogger(
+            audit_file,
+            buffer_size=audit_buffer_size,
+            summary_interval=audit.SUMMARY_INTERVAL if audit_mode == "summary" else None,
+        )
+        self._policy_index: dict | None = None
+        self._indexed_policies: list | None = None
+        self._vault_cache: dict | None = None
+        self._sorted_paths: list[str] | None = None
+        self._indexed_secrets: dict | None = None
+        self._vault_stat: tuple | None = None
+        self._root_key: bytes | None = None
+        self._session_fh = None
+        self._session_stat: tuple | None = None
+
+    def _forget_session(self) -> None:
+        """Drop the cached root key and close the session file handle."""
+        self._root_key = None
+        if self._session_fh is not None:
+            self._session_fh.close()
+            self._session_fh = None
+
+    def _remember_session(self, root_key: bytes) -> bool:
+        """Cache root_key along with the identity of the current session file.
+
+        On POSIX an open handle on the file is kept for _ensure_unsealed().
 
-    def _session_file(self) -> str:
-        """Derive the session file path from the vault file path."""
-        return self.vault_file + ".session"
+        Returns:
+            False if the session file no longer exists.
+        """
+        self._forget_session()
+        try:
+            if _HOLD_SESSION_HANDLE:
+                fh = open(self._session_file, "rb")
+                st = os.fstat(fh.fileno())
+                self._session_fh = fh
+            else:
+                st = os.stat(self._session_file)
+        except FileNotFoundError:
+            return False
+        self._root_key = root_key
+        self._session_stat = (st.st_ino, st.st_size, st.st_mtime_ns)
+        return True
+
+    def _session_unchanged(self) -> bool:
+        """Check whether the session file the cached key came from is still in place."""
+        if self._session_fh is not None:
+            st = os.fstat(self._session_fh.fileno())
+            if not st.st_nlink:
+                return False
+        else:
+            try:
+                st = os.stat(self._session_file)
+            except FileNotFoundError:
+                return False
+        return (st.st_ino, st.st_size, st.st_mtime_ns) == self._session_stat
 
     def _ensure_unsealed(self) -> bytes:
-        """Load the root key from the session file.
+        """Return the root key from the session file.
+
+        The key read by a previous call is reused while the session file
+        it came from is unchanged. On POSIX that is checked with fstat() on
+        a handle held open since then, with no path lookup: a seal from any
+        process unlinks the file (st_nlink drops to 0) and a new unseal
+        rewrites it (size/mtime change), and either sends this back to the
+        file. Elsewhere the file is stat()ed by path.
 
         Returns:
             The root key bytes.
@@ -47,14 +140,125 @@ class Vault:
         Raises:
             VaultError: If the vault is sealed (no session file).
         """
-        root_key = storage.load_session(self._session_file())
-        if root_key is None:
+        if self._root_key is not None and self._session_unchanged():
+            return self._root_key
+
+        root_key = storage.load_session(self._session_file)
+        if root_key is None or not self._remember_session(root_key):
+            self._forget_session()
             raise VaultError("Vault is sealed")
         return root_key
 
+    def _vault_file_stat(self) -> tuple:
+        st = os.stat(self.vault_file)
+        try:
+            wal = os.stat(self._wal_file)
+        except FileNotFoundError:
+            return (st.st_ino, st.st_size, st.st_mtime_ns, None)
+        return (st.st_ino, st.st_size, st.st_mtime_ns, (wal.st_ino, wal.st_size, wal.st_mtime_ns))
+
+    def _get_vault_data(self) -> dict:
+        """Return the vault data, reloading from disk only if the file changed.
+
+        The parsed dict is cached together with the inode, size, and mtime
+        of the vault file and its change log; since save_vault replaces the
+        file atomically and append_changes grows the log, a write by
+        another process always changes the key.
+
+        Returns:
+            The vault data dictionary. Callers that modify it must persist
+            the change with _save_vault_data() or _log_changes().
+
+        Raises:
+            FileNotFoundError: If the vault file does not exist.
+        """
+        file_stat = self._vault_file_stat()
+        if self._vault_cache is None or file_stat != self._vault_stat:
+            self._vault_cache = storage.load_vault(self.vault_file)
+            self._vault_stat = file_stat
+        return self._vault_cache
+
+    def _save_vault_data(self, vault_data: dict) -> None:
+        """Write vault_data to disk and keep it as the cached copy."""
+        try:
+            storage.save_vault(vault_data, self.vault_file, self.fsync_policy)
+        except Exception:
+            # vault_data may hold unsaved changes; reload on next access
+            self._vault_cache = None
+            raise
+        self._vault_cache = vault_data
+        self._vault_stat = self._vault_file_stat()
+
+    def _log_changes(self, vault_data: dict, changes: list[dict]) -> None:
+        """Persist changes made to vault_data by appending them to the change log.
+
+        Only the changes are written, not the whole vault file. Once the
+        log grows past storage.WAL_COMPACT_BYTES the full vault_data is
+        saved instead, which folds the log back into the vault file.
+
+        Args:
+            vault_data: The cached vault data, with the changes applied.
+            changes: Change records; see storage.append_changes().
+        """
+        try:
+            log_size = storage.append_changes(vault_data, self.vault_file, changes, self.fsync_policy)
+        except Exception:
+            self._vault_cache = None
+            raise
+        if log_size > storage.WAL_COMPACT_BYTES:
+            self._save_vault_data(vault_data)
+            return
+        self._vault_cache = vault_data
+        self._vault_stat = self._vault_file_stat()
+
+    @contextlib.contextmanager
+    def _mutating(self):
+        """Guard a section that changes the cached vault data and persists it.
+
+        Mutations are applied to the cached dict in place, so if anything
+        in the section raises before the change is persisted the cache no
+        longer matches the disk; drop it so the next access reloads.
+        """
+        try:
+            yield
+        except BaseException:
+            self._vault_cache = None
+            raise
+
+    def _check_access(self, vault_data: dict, identity: str, path: str, capability: str) -> bool:
+        """Evaluate access against vault_data's policies via a per-identity index.
+
+        The index is rebuilt only when a different policies list is passed
+        in (i.e. the vault was reloaded); add_policy/remove_policy update
+        it in place.
+        """
+        policies = vault_data["policies"]
+        if self._policy_index is None or self._indexed_policies is not policies:
+            self._policy_index = policy.build_policy_index(policies)
+            self._indexed_policies = policies
+        return policy.check_access(self._policy_index, identity, path, capability)
+
+    def _secret_paths(self, vault_data: dict) -> list[str]:
+        """Return vault_data's secret paths in sorted order.
+
+        Like the policy index, the sorted list is rebuilt only when a
+        different secrets dict is passed in; storing or deleting a secret
+        updates it in place.
+        """
+        secrets = vault_data["secrets"]
+        if self._sorted_paths is None or self._indexed_secrets is not secrets:
+            self._sorted_paths = sorted(secrets)
+            self._indexed_secrets = secrets
+        return self._sorted_paths
+
     # -- Seal/Unseal Lifecycle --
 
-    def init_vault(self, password: str) -> str:
+    def init_vault(
+        self,
+        password: str,
+        iterations: int = crypto.MIN_PBKDF2_ITERATIONS,
+        kdf_hash: str = crypto.DEFAULT_PBKDF2_HASH,
+    ) -> str:
         """Create a new vault file with the given master password.
 
         Generates a PBKDF2 salt, derives the root key, creates a verification
@@ -63,22 +267,34 @@ class Vault:
 
         Args:
             password: The master password for the vault.
+            iterations: PBKDF2 iteration count, stored in the vault file.
+                Must be at least crypto.MIN_PBKDF2_ITERATIONS.
+            kdf_hash: PBKDF2 hash function (one of crypto.PBKDF2_HASHES),
+                stored in the vault file.
 
         Returns:
             Success message string.
 
         Raises:
-            VaultError: If vault file already exists or password is empty.
+            VaultError: If vault file already exists, password is empty,
+                iterations is below the minimum, or kdf_hash is unsupported.
         """
         # Fulfills: REQ-SEAL-001, REQ-SEAL-002, REQ-SEAL-003
         if not password:
             raise VaultError("Master password must not be empty")
+        if iterations < crypto.MIN_PBKDF2_ITERATIONS:
+            raise VaultError(
+                f"Iterations must be at least {crypto.MIN_PBKDF2_ITERATIONS}"
+            )
+        if kdf_hash not in crypto.PBKDF2_HASHES:
+            raise VaultError(
+                f"Unsupported KDF hash '{kdf_hash}'. Supported: {', '.join(crypto.PBKDF2_HASHES)}"
+            )
         if storage.vault_file_exists(self.vault_file):
             raise VaultError(f"Vault file already exists at {self.vault_file}")
 
         salt = crypto.generate_salt()
-        iterations = 600000
-        root_key = crypto.derive_root_key(password, salt, iterations)
+        root_key = crypto.derive_root_key(password, salt, iterations, kdf_hash)
 
         # Create verification token for password validation on unseal
         verification_plaintext = b"vault-verification-token"
@@ -87,16 +303,18 @@ class Vault:
         vault_data = {
             "salt": salt,
             "iterations": iterations,
+            "kdf_hash": kdf_hash,
             "verification_nonce": v_nonce,
             "verification_token": v_ciphertext,
             "secrets": {},
             "policies": [],
         }
 
-        storage.save_vault(vault_data, self.vault_file)
-        # Ensure sealed state after init
-        storage.delete_session(self._session_file())
-        audit.log_event(self.audit_file, "system", "init", None, "success")
+        self._save_vault_data(vault_data)
+        # Ensure sealed state after init; close our handle before unlinking
+        self._forget_session()
+        storage.delete_session(self._session_file)
+        self._audit.log_event("system", "init", None, "success")
         return f"Vault initialized at {self.vault_file}"
 
     def unseal(self, password: str) -> str:
@@ -118,10 +336,12 @@ class Vault:
         if not storage.vault_file_exists(self.vault_file):
             raise VaultError(f"Vault file not found at {self.vault_file}")
 
-        vault_data = storage.load_vault(self.vault_file)
+        vault_data = self._get_vault_data()
         salt = vault_data["salt"]
         iterations = vault_data["iterations"]
-        root_key = crypto.derive_root_key(password, salt, iterations)
+        # Vaults created before the hash was selectable use SHA-256
+        kdf_hash = vault_data.get("kdf_hash", crypto.DEFAULT_PBKDF2_HASH)
+        root_key = crypto.derive_root_key(password, salt, iterations, kdf_hash)
 
         # Verify the derived root key by decrypting the verification token
         try:
@@ -131,14 +351,15 @@ class Vault:
                 vault_data["verification_token"],
             )
         except crypto.DecryptionError:
-            audit.log_event(
-                self.audit_file, "system", "unseal", None, "error",
+            self._audit.log_event(
+                "system", "unseal", None, "error",
                 "Incorrect master password",
             )
             raise VaultError("Incorrect master password")
 
-        storage.save_session(self._session_file(), root_key)
-        audit.log_event(self.audit_file, "system", "unseal", None, "success")
+        storage.save_session(self._session_file, root_key)
+        self._remember_session(root_key)
+        self._audit.log_event("system", "unseal", None, "success")
         return "Vault unsealed successfully."
 
     def seal(self) -> str:
@@ -151,12 +372,17 @@ class Vault:
             VaultError: If the vault is already sealed.
         """
         # Fulfills: REQ-SEAL-006
-        root_key = storage.load_session(self._session_file())
+        root_key = storage.load_session(self._session_file)
         if root_key is None:
             raise VaultError("Vault is already sealed")
 
-        storage.delete_session(self._session_file())
-        audit.log_event(self.audit_file, "system", "seal", None, "success")
+        # Fold the change log into the vault file while the key is still around
+        if storage.change_log_exists(self.vault_file):
+            self._save_vault_data(self._get_vault_data())
+        self._forget_session()
+        storage.delete_session(self._session_file)
+        self._vault_cache = None
+        self._audit.log_event("system", "seal", None, "success")
         return "Vault sealed."
 
     def status(self) -> str:
@@ -172,8 +398,8 @@ class Vault:
         if not storage.vault_file_exists(self.vault_file):
             raise VaultError(f"Vault file not found at {self.vault_file}")
 
-        root_key = storage.load_session(self._session_file())
-        if root_key is not None:
+        # Existence is enough; the key itself is validated when it is used
+        if storage.session_file_exists(self._session_file):
             return "unsealed"
         return "sealed"
 
@@ -205,18 +431,23 @@ class Vault:
                 f"Invalid capability '{invalid}'. Valid capabilities: read, write, list, delete"
             )
 
-        vault_data = storage.load_vault(self.vault_file)
+        vault_data = self._get_vault_data()
         new_policy = {
             "identity": identity,
             "path_pattern": path_pattern,
             "capabilities": capabilities,
         }
-        vault_data["policies"].append(new_policy)
-        storage.save_vault(vault_data, self.vault_file)
+        policies = vault_data["policies"]
+        indexed = self._policy_index is not None and self._indexed_policies is policies
+        with self._mutating():
+            policies.append(new_policy)
+            self._log_changes(vault_data, [{"op": "add_policy", "policy": new_policy}])
+            if indexed:
+                policy.index_policy(self._policy_index, new_policy)
 
         caps_str = ", ".join(capabilities)
-        audit.log_event(
-            self.audit_file, "system", "add-policy", None, "success",
+        self._audit.log_event(
+            "system", "add-policy", None, "success",
             f"identity='{identity}', path='{path_pattern}'",
         )
         return f"Policy added: identity='{identity}', path='{path_pattern}', capabilities=[{caps_str}]"
@@ -237,22 +468,29 @@ class Vault:
         # Fulfills: REQ-ACL-009
         self._ensure_unsealed()
 
-        vault_data = storage.load_vault(self.vault_file)
-        found = False
-        for i, pol in enumerate(vault_data["policies"]):
+        vault_data = self._get_vault_data()
+        policies = vault_data["policies"]
+        indexed = self._policy_index is not None and self._indexed_policies is policies
+        for i, pol in enumerate(policies):
             if pol["identity"] == identity and pol["path_pattern"] == path_pattern:
-                vault_data["policies"].pop(i)
-                found = True
                 break
-
-        if not found:
+        else:
             raise VaultError(
                 f"No policy found for identity '{identity}' on path '{path_pattern}'"
             )
 
-        storage.save_vault(vault_data, self.vault_file)
-        audit.log_event(
-            self.audit_file, "system", "remove-policy", None, "success",
+        with self._mutating():
+            # Policy order carries no meaning: move the last one into the
+            # hole instead of shifting the tail
+            policies[i] = policies[-1]
+            policies.pop()
+            self._log_changes(vault_data, [
+                {"op": "remove_policy", "identity": identity, "path_pattern": path_pattern},
+            ])
+            if indexed:
+                policy.reindex_identity(self._policy_index, policies, identity)
+        self._audit.log_event(
+            "system", "remove-policy", None, "success",
             f"identity='{identity}', path='{path_pattern}'",
         )
         return f"Policy removed: identity='{identity}', path='{path_pattern}'"
@@ -286,19 +524,110 @@ class Vault:
         if not value:
             raise VaultError("Secret value must not be empty")
 
-        vault_data = storage.load_vault(self.vault_file)
+        vault_data = self._get_vault_data()
 
         # Check access control (write capability required)
-        if not policy.check_access(vault_data["policies"], identity, path, "write"):
-            audit.log_event(self.audit_file, identity, "store", path, "denied", "requires write")
+        if not self._check_access(vault_data, identity, path, "write"):
+            self._audit.log_event(identity, "store", path, "denied", "requires write")
             raise VaultError(
                 f"Access denied for identity '{identity}' on path '{path}' (requires write)"
             )
 
+        with self._mutating():
+            root_cipher = crypto.aes_gcm_cipher(root_key)
+            operation, version_dict = self._stage_secret(vault_data, root_cipher, path, value)
+
+            self._log_changes(vault_data, [{"op": "put", "path": path, "version": version_dict}])
+        self._audit.log_event(identity, operation, path, "success")
+        return self._put_message(path, operation, version_dict["version_number"])
+
+    def put_secrets_batch(self, items: list[tuple[str, str, str]]) -> list[str]:
+        """Store or update several secrets with a single vault write.
+
+        Every item is validated and access-checked before anything is
+        encrypted, so the batch is all-or-nothing: on any error no secret
+        is written. The new versions are appended to the change log, and
+        the success entries to the audit log, with a single write each.
+
+        Args:
+            items: List of (path, value, identity) tuples, applied in order.
+
+        Returns:
+            One success message per item, as returned by put_secret.
+
+        Raises:
+            VaultError: If sealed, or any item is not a tuple of strings, has
+                an invalid path or an empty value, or lacks write access.
+        """
+        root_key = self._ensure_unsealed()
+
+        for path, value, identity in items:
+            if not isinstance(path, str) or not isinstance(value, str) or not isinstance(identity, str):
+                raise VaultError("Batch items must be (path, value, identity) strings")
+            if not policy.validate_path(path):
+                raise VaultError(f"Invalid path format: '{path}'")
+            if not value:
+                raise VaultError("Secret value must not be empty")
+
+        vault_data = self._get_vault_data()
+
+        for path, _value, identity in items:
+            if not self._check_access(vault_data, identity, path, "write"):
+                self._audit.log_event(identity, "store", path, "denied", "requires write")
+                raise VaultError(
+                    f"Access denied for identity '{identity}' on path '{path}' (requires write)"
+                )
+
+        # One root-key cipher protects every DEK in the batch, and all DEKs
+        # and nonces come from a single draw of random bytes
+        with self._mutating():
+            root_cipher = crypto.aes_gcm_cipher(root_key)
+            material = crypto.generate_key_material(len(items))
+            staged = [
+                (path, identity, *self._stage_secret(vault_data, root_cipher, path, value, keys))
+                for (path, value, identity), keys in zip(items, material)
+            ]
+
+            if staged:
+                self._log_changes(vault_data, [
+                    {"op": "put", "path": path, "version": version_dict}
+                    for path, _identity, _operation, version_dict in staged
+                ])
+        self._audit.log_events([
+            (identity, operation, path, "success")
+            for path, identity, operation, _version_dict in staged
+        ])
+        return [
+            self._put_message(path, operation, version_dict["version_number"])
+            for path, _identity, operation, version_dict in staged
+        ]
+
+    def _stage_secret(
+        self,
+        vault_data: dict,
+        root_cipher,
+        path: str,
+        value: str,
+        key_material: tuple[bytes, bytes, bytes] | None = None,
+    ) -> tuple[str, dict]:
+        """Encrypt value and add it to vault_data as a new secret or version.
+
+        Performs envelope encryption: generates a DEK, encrypts the value
+        with the DEK, encrypts the DEK with the root key (root_cipher, from
+        crypto.aes_gcm_cipher). Does not save. key_material is an optional
+        (dek, value_nonce, dek_nonce) tuple from crypto.generate_key_material().
+
+        Returns:
+            Tuple of (operation, version_dict) where operation is "store"
+            for a new secret or "update" for a new version.
+        """
         # Envelope encryption: generate DEK, encrypt value, encrypt DEK
-        dek = crypto.generate_dek()
-        value_nonce, encrypted_value = crypto.encrypt_aes_gcm(dek, value.encode("utf-8"))
-        dek_nonce, encrypted_dek = crypto.encrypt_aes_gcm(root_key, dek)
+        if key_material is None:
+            dek, value_nonce, dek_nonce = crypto.generate_dek(), None, None
+        else:
+            dek, value_nonce, dek_nonce = key_material
+        value_nonce, encrypted_value = crypto.encrypt_aes_gcm(dek, value.encode("utf-8"), value_nonce)
+        dek_nonce, encrypted_dek = crypto.encrypt_with(root_cipher, dek, dek_nonce)
 
         version_dict = {
             "version_number": 1,
@@ -306,31 +635,33 @@ class Vault:
             "dek_nonce": dek_nonce,
             "encrypted_value": encrypted_value,
             "value_nonce": value_nonce,
-            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "created_at": audit.utc_now_iso(),
         }
 
-        if path in vault_data["secrets"]:
+        secrets = vault_data["secrets"]
+        existing = secrets.get(path)
+        if existing is not None:
             # Update existing secret with new version
-            versions = vault_data["secrets"][path]["versions"]
+            versions = existing["versions"]
             next_version = len(versions) + 1
             version_dict["version_number"] = next_version
             versions.append(version_dict)
-            operation = "update"
-        else:
-            # Store new secret
-            vault_data["secrets"][path] = {
-                "path": path,
-                "versions": [version_dict],
-            }
-            next_version = 1
-            operation = "store"
+            return "update", version_dict
 
-        storage.save_vault(vault_data, self.vault_file)
-        audit.log_event(self.audit_file, identity, operation, path, "success")
+        # Store new secret
+        if self._sorted_paths is not None and self._indexed_secrets is secrets:
+            bisect.insort(self._sorted_paths, path)
+        secrets[path] = {
+            "path": path,
+            "versions": [version_dict],
+        }
+        return "store", version_dict
 
+    @staticmethod
+    def _put_message(path: str, operation: str, version: int) -> str:
         if operation == "store":
             return f"Secret stored at {path} (version 1)"
-        return f"Secret updated at {path} (version {next_version})"
+        return f"Secret updated at {path} (version {version})"
 
     def get_secret(self, path: str, identity: str, version: int | None = None) -> dict:
         """Retrieve a secret at the given path, optionally a specific version.
@@ -353,44 +684,107 @@ class Vault:
         #           REQ-VER-003, REQ-VER-004, REQ-VER-005, REQ-VER-006
         root_key = self._ensure_unsealed()
 
-        vault_data = storage.load_vault(self.vault_file)
+        vault_data = self._get_vault_data()
 
         # Check access control (read capability required)
-        if not policy.check_access(vault_data["policies"], identity, path, "read"):
-            audit.log_event(self.audit_file, identity, "retrieve", path, "denied", "requires read")
+        if not self._check_access(vault_data, identity, path, "read"):
+            self._audit.log_event(identity, "retrieve", path, "denied", "requires read")
             raise VaultError(
                 f"Access denied for identity '{identity}' on path '{path}' (requires read)"
             )
 
-        if path not in vault_data["secrets"]:
+        secret = vault_data["secrets"].get(path)
+        if secret is None:
             raise VaultError(f"Secret not found at path '{path}'")
 
-        versions = vault_data["secrets"][path]["versions"]
+        versions = secret["versions"]
 
         if version is None:
             # Return the latest version (highest version_number)
             selected = versions[-1]
         else:
-            # Find the specified version
+            # Versions are numbered 1..N in append order, so version N sits
+            # at index N-1; scan only if that invariant does not hold
             selected = None
-            for v in versions:
-                if v["version_number"] == version:
-                    selected = v
-                    break
+            if 1 <= version <= len(versions) and versions[version - 1]["version_number"] == version:
+                selected = versions[version - 1]
+            else:
+                for v in versions:
+                    if v["version_number"] == version:
+                        selected = v
+                        break
             if selected is None:
                 raise VaultError(f"Version {version} not found for path '{path}'")
 
-        # Envelope decryption: decrypt DEK, then decrypt value
-        dek = crypto.decrypt_aes_gcm(root_key, selected["dek_nonce"], selected["encrypted_dek"])
-        plaintext = crypto.decrypt_aes_gcm(dek, selected["value_nonce"], selected["encrypted_value"])
+        value = self._open_version(crypto.aes_gcm_cipher(root_key), selected)
 
-        audit.log_event(self.audit_file, identity, "retrieve", path, "success")
+        self._audit.count_event(identity, "retrieve", path)
         return {
             "path": path,
             "version": selected["version_number"],
-            "value": plaintext.decode("utf-8"),
+            "value": value,
         }
 
+    @staticmethod
+    def _open_version(root_cipher, version_dict: dict) -> str:
+        """Decrypt one stored version and return its value.
+
+        Performs envelope decryption: decrypts the DEK with the root key
+        (root_cipher, from crypto.aes_gcm_cipher), then decrypts the value
+        with the DEK. The inverse of _stage_secret().
+        """
+        storage.decode_version(version_dict)
+        dek = crypto.decrypt_with(root_cipher, version_dict["dek_nonce"], version_dict["encrypted_dek"])
+        plaintext = crypto.decrypt_aes_gcm(dek, version_dict["value_nonce"], version_dict["encrypted_value"])
+        return plaintext.decode("utf-8")
+
+    def get_secrets(self, paths: list[str], identity: str) -> list[dict]:
+        """Retrieve the latest version of several secrets in one pass.
+
+        The vault is loaded once, every path is access-checked and looked up
+        before anything is decrypted, and the success entries are appended
+        to the audit log with a single write. On any error nothing is
+        returned; the path that failed gets a "denied" or "error" audit
+        entry, and the other paths none.
+
+        Args:
+            paths: The secret paths, in the order results are wanted.
+            identity: The caller's identity for access control.
+
+        Returns:
+            One dict per path with keys: 'path', 'version', 'value'.
+
+        Raises:
+            VaultError: If sealed, or any path is denied or not found.
+        """
+        root_key = self._ensure_unsealed()
+
+        vault_data = self._get_vault_data()
+        secrets = vault_data["secrets"]
+
+        for path in paths:
+            if not self._check_access(vault_data, identity, path, "read"):
+                self._audit.log_event(identity, "retrieve", path, "denied", "requires read")
+                raise VaultError(
+                    f"Access denied for identity '{identity}' on path '{path}' (requires read)"
+                )
+            if path not in secrets:
+                self._audit.log_event(identity, "retrieve", path, "error", "not found")
+                raise VaultError(f"Secret not found at path '{path}'")
+
+        root_cipher = crypto.aes_gcm_cipher(root_key)
+        results = []
+        for path in paths:
+            selected = secrets[path]["versions"][-1]
+            results.append({
+                "path": path,
+                "version": selected["version_number"],
+                "value": self._open_version(root_cipher, selected),
+            })
+
+        self._audit.count_events([(identity, "retrieve", path) for path in paths])
+        return results
+
     def delete_secret(self, path: str, identity: str) -> str:
         """Delete a secret and all its versions at the given path.
 
@@ -407,21 +801,25 @@ class Vault:
         # Fulfills: REQ-CRUD-004, REQ-CRUD-006
         self._ensure_unsealed()
 
-        vault_data = storage.load_vault(self.vault_file)
+        vault_data = self._get_vault_data()
 
         # Check access control (delete capability required)
-        if not policy.check_access(vault_data["policies"], identity, path, "delete"):
-            audit.log_event(self.audit_file, identity, "delete", path, "denied", "requires delete")
+        if not self._check_access(vault_data, identity, path, "delete"):
+            self._audit.log_event(identity, "delete", path, "denied", "requires delete")
             raise VaultError(
                 f"Access denied for identity '{identity}' on path '{path}' (requires delete)"
             )
 
-        if path not in vault_data["secrets"]:
+        secrets = vault_data["secrets"]
+        if path not in secrets:
             raise VaultError(f"Secret not found at path '{path}'")
 
-        del vault_data["secrets"][path]
-        storage.save_vault(vault_data, self.vault_file)
-        audit.log_event(self.audit_file, identity, "delete", path, "success")
+        with self._mutating():
+            if self._sorted_paths is not None and self._indexed_secrets is secrets:
+                del self._sorted_paths[bisect.bisect_left(self._sorted_paths, path)]
+            del secrets[path]
+            self._log_changes(vault_data, [{"op": "delete", "path": path}])
+        self._audit.log_event(identity, "delete", path, "success")
         return f"Secret deleted at {path}"
 
     def list_secrets(self, identity: str, prefix: str = "") -> list[str]:
@@ -440,26 +838,30 @@ class Vault:
         # Fulfills: REQ-CRUD-005
         self._ensure_unsealed()
 
-        vault_data = storage.load_vault(self.vault_file)
+        vault_data = self._get_vault_data()
 
         # Check access control (list capability on the prefix)
         check_path = prefix if prefix else ""
-        if not policy.check_access(vault_data["policies"], identity, check_path, "list"):
-            audit.log_event(
-                self.audit_file, identity, "list", prefix or "-", "denied", "requires list",
+        if not self._check_access(vault_data, identity, check_path, "list"):
+            self._audit.log_event(
+                identity, "list", prefix or "-", "denied", "requires list",
             )
             raise VaultError(
                 f"Access denied for identity '{identity}' on path '{prefix}' (requires list)"
             )
 
-        # Collect paths matching the prefix
-        matching = []
-        for secret_path in vault_data["secrets"]:
-            if prefix == "" or secret_path.startswith(prefix):
-                matching.append(secret_path)
+        # Paths sharing the prefix form one contiguous run of the sorted
+        # list, bounded above by the prefix followed by the highest code
+        # point; both ends are found by bisection with no per-path loop
+        paths = self._secret_paths(vault_data)
+        if prefix:
+            start = bisect.bisect_left(paths, prefix)
+            end = bisect.bisect_left(paths, prefix + "\U0010ffff", start)
+            matching = paths[start:end]
+        else:
+            matching = paths[:]
 
-        matching.sort()
-        audit.log_event(self.audit_file, identity, "list", prefix or "-", "success")
+        self._audit.count_event(identity, "list", prefix or "-")
         return matching
 
     # -- Audit Log --
@@ -476,7 +878,36 @@ class Vault:
         Raises:
             VaultError: If the audit file is not found.
         """
+        self._audit.flush()
         try:
-            return audit.read_log(self.audit_file, last_n)
+            lines = audit.read_log(self.audit_file, last_n)
         except FileNotFoundError:
             raise VaultError(f"Audit log file not found at {self.audit_file}")
+        return [audit.format_entry(line) for line in lines]
+
+    def verify_audit_log(self) -> str:
+        """Verify the audit log's hash chain.
+
+        Returns:
+            Success message with the number of entries checked.
+
+        Raises:
+            VaultError: If the audit file is not found or the chain is broken.
+        """
+        self._audit.flush()
+        try:
+            count, broken_at = audit.verify_chain(self.audit_file)
+        except FileNotFoundError:
+            raise VaultError(f"Audit log file not found at {self.audit_file}")
+        if broken_at is not None:
+            raise VaultError(f"Audit log chain broken at entry {broken_at}")
+        return f"Audit log chain intact ({count} entries)"
+
+    def close(self) -> None:
+        """Release the session file handle and flush and close the audit log.
+
+        The vault stays unsealed; the root key is simply read again from
+        the session file if this instance is used afterwards.
+        """
+        self._forget_session()
+        self._audit.close()